@@ -1,3 +1,4 @@
+import functools
 import os
 from pathlib import Path
 from typing import Literal, Optional
@@ -8,25 +9,25 @@ from deepagents.backends import CompositeBackend, StateBackend, StoreBackend, Fi
 from deepagents.middleware.filesystem import FilesystemMiddleware
 # from langchain.agents.middleware import TodoListMiddleware
 from middlewares.optimizedTodoMiddleware import OptimizedTodoMiddleware
+from langchain_core.messages import SystemMessage
 from langchain_openai import ChatOpenAI
 from unity_tools import unity_tools
 from prompts import UNITY_AGENT_PROMPT
 
 load_dotenv()
 
-# Unity project path - set in .env file
-UNITY_PROJECT_PATH = os.getenv("UNITY_PROJECT_PATH")
-if not UNITY_PROJECT_PATH:
-    raise ValueError("UNITY_PROJECT_PATH environment variable must be set")
-
-# Pre-resolve the path at module load time (synchronous context is fine here)
-UNITY_PROJECT_PATH_RESOLVED = str(Path(UNITY_PROJECT_PATH).resolve())
-
-# Pre-create FilesystemBackend at module level (blocking is OK here)
-_unity_fs_backend = FilesystemBackend(
-    root_dir=UNITY_PROJECT_PATH_RESOLVED,
-    virtual_mode=True
-)
+# Unity project backend - resolved on first use rather than at import, so
+# importing this module doesn't pay path resolution (or hard-fail on a
+# missing env var) before an agent actually touches the filesystem.
+@functools.cache
+def _get_unity_fs_backend() -> FilesystemBackend:
+    unity_project_path = os.getenv("UNITY_PROJECT_PATH")
+    if not unity_project_path:
+        raise ValueError("UNITY_PROJECT_PATH environment variable must be set")
+    return FilesystemBackend(
+        root_dir=str(Path(unity_project_path).resolve()),
+        virtual_mode=True
+    )
 
 tavily_client = TavilyClient(api_key=os.environ["TAVILY_API_KEY"])
 
@@ -45,6 +46,11 @@ model = ChatOpenAI(
 )
 
 
+# Last (runtime, backend) pair; the middleware asks for a backend repeatedly
+# within one runtime, so an identity memo collapses those to one allocation
+_backend_memo = (None, None)
+
+
 def make_composite_backend(runtime):
     """
     Routes:
@@ -52,13 +58,20 @@ def make_composite_backend(runtime):
     - /scratch/   → StateBackend (ephemeral, current thread only)
     - everything else → FilesystemBackend (Unity project on disk)
     """
-    return CompositeBackend(
-        default=_unity_fs_backend,  # Use pre-created instance
+    global _backend_memo
+    memo_runtime, memo_backend = _backend_memo
+    if memo_runtime is runtime:
+        return memo_backend
+
+    backend = CompositeBackend(
+        default=_get_unity_fs_backend(),  # Cached after first call
         routes={
             "/memories/": StoreBackend(runtime),
             "/scratch/": StateBackend(runtime),
         }
     )
+    _backend_memo = (runtime, backend)
+    return backend
 
 
 # Checkpointer will be injected by server.py after database initialization
@@ -66,9 +79,16 @@ def make_composite_backend(runtime):
 _checkpointer = None
 
 
+# Compiled agents keyed by checkpointer identity. Graph compilation plus
+# middleware/tool registration is real CPU; the server only ever uses a
+# couple of checkpointers, so cache the compiled graph per checkpointer.
+# The checkpointer itself is stored too, keeping its id() stable.
+_agent_cache: dict = {}
+
+
 def create_movesia_agent(checkpointer=None):
     """
-    Create the Movesia agent with the given checkpointer.
+    Create (or return the cached) Movesia agent for the given checkpointer.
 
     Args:
         checkpointer: LangGraph checkpointer (AsyncSqliteSaver or MemorySaver)
@@ -76,10 +96,30 @@ def create_movesia_agent(checkpointer=None):
     Returns:
         Compiled LangGraph agent
     """
+    cache_key = id(checkpointer)
+    cached = _agent_cache.get(cache_key)
+    if cached is not None and cached[0] is checkpointer:
+        return cached[1]
+
+    agent = _build_agent(checkpointer)
+    _agent_cache[cache_key] = (checkpointer, agent)
+    return agent
+
+
+# Built once: the system prompt never varies per turn, and the cache_control
+# marker lets Anthropic-compatible providers reuse the cached prefill for it
+_UNITY_SYSTEM_MESSAGE = SystemMessage(
+    content=UNITY_AGENT_PROMPT,
+    additional_kwargs={"cache_control": {"type": "ephemeral"}},
+)
+
+
+def _build_agent(checkpointer):
+    """Compile a fresh agent graph."""
     return create_agent(
         model=model,
         tools=[internet_search, *unity_tools],
-        system_prompt=UNITY_AGENT_PROMPT,
+        system_prompt=_UNITY_SYSTEM_MESSAGE,
         middleware=[
             # TodoListMiddleware(),  # Original - ~1,400 tokens
             OptimizedTodoMiddleware(),  # Optimized - ~520 tokens (balanced mode)
@@ -6,11 +6,14 @@ Single SQLite database for:
 - LangGraph checkpoints (AsyncSqliteSaver tables)
 """
 
+import asyncio
 import os
 import logging
 from pathlib import Path
 from typing import Optional
 
+from sqlalchemy import event, text
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncSession,
@@ -46,6 +49,27 @@ def get_database_path() -> str:
     return str(data_dir / "movesia.db")
 
 
+# WAL avoids the rollback-journal double flush on every commit, NORMAL skips
+# the extra fsync that FULL pays (still durable under WAL short of power
+# loss), and the mmap/cache settings keep hot checkpoint pages out of the
+# syscall path. The workload here is many small writes.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _apply_pragmas_sync(dbapi_conn, _connection_record) -> None:
+    """Apply performance PRAGMAs to each raw connection the engine opens."""
+    cursor = dbapi_conn.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
 async def init_database() -> async_sessionmaker[AsyncSession]:
     """
     Initialize the database engine and create tables.
@@ -59,11 +83,19 @@ async def init_database() -> async_sessionmaker[AsyncSession]:
     logger.info(f"Initializing database at: {db_path}")
 
     # Create async engine
+    # The sqlite dialect defaults to NullPool for file databases, so every
+    # session would open a fresh connection (and re-run the PRAGMAs). Keep a
+    # small persistent pool instead; under WAL multiple connections on one
+    # file coexist fine, and the checkpointer keeps its own connection below.
     _engine = create_async_engine(
         f"sqlite+aiosqlite:///{db_path}",
         echo=False,
         connect_args={"check_same_thread": False},
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=4,
+        max_overflow=0,
     )
+    event.listen(_engine.sync_engine, "connect", _apply_pragmas_sync)
 
     # Create session factory
     _session_factory = async_sessionmaker(
@@ -72,11 +104,25 @@ async def init_database() -> async_sessionmaker[AsyncSession]:
         expire_on_commit=False,
     )
 
-    # Create our tables
-    async with _engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    logger.info("Database tables created/verified")
+    async def _create_app_tables() -> None:
+        async with _engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            # create_all(checkfirst) skips tables that already exist -
+            # including their indexes - so databases created before the
+            # composite index was introduced never pick it up from the
+            # model alone. Apply the rename explicitly; both statements
+            # are no-ops on fresh and already-migrated databases.
+            await conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS idx_conversations_updated_desc_id "
+                "ON conversations (updated_at DESC, id)"
+            ))
+            await conn.execute(text(
+                "DROP INDEX IF EXISTS idx_conversations_updated_at"
+            ))
+            # Refresh planner statistics so the session_id and
+            # updated_at-DESC indexes actually get picked
+            await conn.execute(text("ANALYZE"))
+        logger.info("Database tables created/verified")
 
     # Initialize LangGraph checkpoint saver (same database)
     global _checkpoint_conn
@@ -87,8 +133,14 @@ async def init_database() -> async_sessionmaker[AsyncSession]:
         # AsyncSqliteSaver.from_conn_string returns a context manager
         # We need to create the connection and saver manually
         _checkpoint_conn = await aiosqlite.connect(db_path)
+        # Same PRAGMAs for the checkpointer's own connection; WAL lets the
+        # two writers coexist on one file without journal contention
+        for pragma in _SQLITE_PRAGMAS:
+            await _checkpoint_conn.execute(pragma)
         _checkpoint_saver = AsyncSqliteSaver(_checkpoint_conn)
-        await _checkpoint_saver.setup()  # Create checkpoint tables
+        # Two independent DDL batches; overlap them so startup (and FastAPI
+        # readiness) pays the slower of the two instead of their sum
+        await asyncio.gather(_create_app_tables(), _checkpoint_saver.setup())
         logger.info("LangGraph AsyncSqliteSaver initialized (same DB)")
     except ImportError as e:
         logger.warning(
@@ -98,6 +150,7 @@ async def init_database() -> async_sessionmaker[AsyncSession]:
         from langgraph.checkpoint.memory import MemorySaver
         _checkpoint_saver = MemorySaver()
         logger.info("Falling back to MemorySaver (no persistence)")
+        await _create_app_tables()
 
     return _session_factory
 
@@ -106,6 +159,11 @@ async def close_database() -> None:
     """Close database connections gracefully."""
     global _engine, _session_factory, _checkpoint_saver, _checkpoint_conn
 
+    # Flush any debounced repository writes before the engine goes away
+    from .repository import _repository
+    if _repository is not None:
+        await _repository.shutdown()
+
     if _checkpoint_conn:
         await _checkpoint_conn.close()
         logger.info("Checkpoint connection closed")
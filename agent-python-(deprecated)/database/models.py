@@ -44,7 +44,9 @@ class Conversation(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     __table_args__ = (
-        Index("idx_conversations_updated_at", "updated_at"),
+        # Composite index matching list_all's ORDER BY, so paging is a pure
+        # index walk with id as the tie-breaker.
+        Index("idx_conversations_updated_desc_id", updated_at.desc(), "id"),
     )
 
     def __repr__(self):
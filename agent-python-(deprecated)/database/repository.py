@@ -5,11 +5,12 @@ Messages and tool executions are handled by LangGraph's checkpointer.
 This only manages thread/conversation metadata for listing and search.
 """
 
+import asyncio
 import logging
-from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Set
 
-from sqlalchemy import select, update
+from sqlalchemy import RowMapping, delete as sa_delete, func, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .models import Conversation
@@ -17,10 +18,19 @@ from .engine import DatabaseSession
 
 logger = logging.getLogger("movesia.database")
 
+# How long touch() coalesces before committing. One fsync per window instead
+# of one per message.
+_TOUCH_FLUSH_INTERVAL = 1.0
+
 
 class ConversationRepository:
     """Repository for conversation metadata operations."""
 
+    def __init__(self):
+        # Session ids with a pending updated_at bump, flushed in one UPDATE
+        self._pending_touches: Set[str] = set()
+        self._touch_flush_task: Optional[asyncio.Task] = None
+
     async def get_or_create(
         self,
         session_id: str,
@@ -33,32 +43,36 @@ class ConversationRepository:
         Called when a chat session starts to ensure we have metadata.
         """
         async with DatabaseSession() as session:
-            result = await session.execute(
-                select(Conversation).where(Conversation.session_id == session_id)
-            )
-            conversation = result.scalar_one_or_none()
-
-            if conversation:
-                # Update metadata if provided
-                if unity_project_path and not conversation.unity_project_path:
-                    conversation.unity_project_path = unity_project_path
-                if unity_version and not conversation.unity_version:
-                    conversation.unity_version = unity_version
-                conversation.updated_at = datetime.utcnow()
-                await session.commit()
-                return conversation
-
-            # Create new
-            conversation = Conversation(
-                session_id=session_id,
-                unity_project_path=unity_project_path,
-                unity_version=unity_version,
+            # Single atomic upsert instead of SELECT + mutate + COMMIT: one
+            # round-trip, and no lost-update race when two chat sessions
+            # start concurrently. COALESCE keeps existing metadata, filling
+            # it only where the row has none.
+            stmt = (
+                sqlite_insert(Conversation)
+                .values(
+                    session_id=session_id,
+                    unity_project_path=unity_project_path,
+                    unity_version=unity_version,
+                )
+                .on_conflict_do_update(
+                    index_elements=["session_id"],
+                    set_={
+                        "unity_project_path": func.coalesce(
+                            Conversation.unity_project_path,
+                            unity_project_path,
+                        ),
+                        "unity_version": func.coalesce(
+                            Conversation.unity_version,
+                            unity_version,
+                        ),
+                        "updated_at": func.now(),
+                    },
+                )
+                .returning(Conversation)
             )
-            session.add(conversation)
+            result = await session.execute(stmt)
+            conversation = result.scalar_one()
             await session.commit()
-            await session.refresh(conversation)
-
-            logger.info(f"Created conversation: {conversation.id[:8]} for session {session_id[:8]}")
             return conversation
 
     async def get(self, session_id: str) -> Optional[Conversation]:
@@ -73,16 +87,30 @@ class ConversationRepository:
         self,
         limit: int = 50,
         offset: int = 0,
-    ) -> List[Conversation]:
-        """List conversations, ordered by most recently updated."""
+    ) -> List[RowMapping]:
+        """List conversation rows, ordered by most recently updated.
+
+        Selects only the metadata columns the API returns and streams the
+        result server-side, yielding plain mappings - no ORM hydration,
+        identity-map insertion, or attribute-expiration machinery for what
+        is a read-only listing.
+        """
         async with DatabaseSession() as session:
-            result = await session.execute(
-                select(Conversation)
-                .order_by(Conversation.updated_at.desc())
+            result = await session.stream(
+                select(
+                    Conversation.id,
+                    Conversation.session_id,
+                    Conversation.title,
+                    Conversation.unity_project_path,
+                    Conversation.unity_version,
+                    Conversation.created_at,
+                    Conversation.updated_at,
+                )
+                .order_by(Conversation.updated_at.desc(), Conversation.id)
                 .limit(limit)
                 .offset(offset)
             )
-            return list(result.scalars().all())
+            return [row._mapping for row in await result.all()]
 
     async def update_title(self, session_id: str, title: str) -> None:
         """Update conversation title (auto-generated from first user message)."""
@@ -90,33 +118,62 @@ class ConversationRepository:
             await session.execute(
                 update(Conversation)
                 .where(Conversation.session_id == session_id)
-                .values(title=title[:500], updated_at=datetime.utcnow())
+                .values(title=title[:500], updated_at=func.now())
             )
             await session.commit()
 
     async def touch(self, session_id: str) -> None:
-        """Update the updated_at timestamp (call on each message)."""
-        async with DatabaseSession() as session:
-            await session.execute(
-                update(Conversation)
-                .where(Conversation.session_id == session_id)
-                .values(updated_at=datetime.utcnow())
-            )
-            await session.commit()
+        """Mark a conversation's updated_at for refresh (call on each message).
+
+        Touches are debounced: ids accumulate for _TOUCH_FLUSH_INTERVAL and
+        then commit as a single UPDATE using the database clock, so a burst
+        of messages costs one fsync instead of one per message.
+        """
+        self._pending_touches.add(session_id)
+        if self._touch_flush_task is None or self._touch_flush_task.done():
+            self._touch_flush_task = asyncio.create_task(self._touch_flush_later())
+
+    async def _touch_flush_later(self) -> None:
+        """Sleep out the debounce window, then flush."""
+        await asyncio.sleep(_TOUCH_FLUSH_INTERVAL)
+        await self.flush_touches()
+
+    async def flush_touches(self) -> None:
+        """Commit all coalesced touches in one UPDATE."""
+        pending, self._pending_touches = self._pending_touches, set()
+        if not pending:
+            return
+        try:
+            async with DatabaseSession() as session:
+                await session.execute(
+                    update(Conversation)
+                    .where(Conversation.session_id.in_(pending))
+                    .values(updated_at=func.now())
+                )
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"Failed to flush {len(pending)} touch updates: {e}")
+
+    async def shutdown(self) -> None:
+        """Stop the debounce task and flush pending touches (server shutdown)."""
+        task = self._touch_flush_task
+        if task is not None and not task.done():
+            task.cancel()
+        await self.flush_touches()
 
     async def delete(self, session_id: str) -> bool:
         """Delete a conversation. Returns True if deleted."""
         async with DatabaseSession() as session:
+            # One DELETE ... RETURNING instead of SELECT + ORM delete (which
+            # re-selects for cascade bookkeeping the table doesn't have)
             result = await session.execute(
-                select(Conversation).where(Conversation.session_id == session_id)
+                sa_delete(Conversation)
+                .where(Conversation.session_id == session_id)
+                .returning(Conversation.id)
             )
-            conversation = result.scalar_one_or_none()
-
-            if conversation:
-                await session.delete(conversation)
-                await session.commit()
-                return True
-            return False
+            deleted_id = result.scalar_one_or_none()
+            await session.commit()
+            return deleted_id is not None
 
 
 # Global repository instance
@@ -7,9 +7,11 @@ Import it from: from unity import UnityManager
 
 from .interrupt_manager import InterruptManager
 from .chat_manager import ChatManager, ChatSession
+from .admission_controller import AdmissionController
 
 __all__ = [
     "InterruptManager",
     "ChatManager",
     "ChatSession",
+    "AdmissionController",
 ]
@@ -0,0 +1,66 @@
+"""
+Admission Controller - Bounds concurrent agent chat streams.
+
+Each chat stream runs a full agent loop (model calls, tool calls,
+checkpoint writes). Letting an unbounded number run at once degrades
+every stream, so requests past the limit wait briefly for a slot and
+are rejected if none frees up.
+"""
+
+import asyncio
+import logging
+import os
+
+logger = logging.getLogger("movesia.chat")
+
+MAX_CONCURRENT_STREAMS = int(os.getenv("MAX_CONCURRENT_STREAMS", "8"))
+ADMISSION_TIMEOUT = float(os.getenv("ADMISSION_TIMEOUT", "5.0"))
+
+
+class AdmissionController:
+    """
+    Condition-based admission control for concurrent chat streams.
+
+    Usage:
+        controller = AdmissionController()
+
+        if not await controller.acquire():
+            ...reject the request...
+        try:
+            ...run the stream...
+        finally:
+            await controller.release()
+    """
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_STREAMS):
+        self._max_concurrent = max_concurrent
+        self._active = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def active_count(self) -> int:
+        return self._active
+
+    async def acquire(self, timeout: float = ADMISSION_TIMEOUT) -> bool:
+        """Wait for a stream slot. Returns False if none frees up in time."""
+        async with self._condition:
+            if self._active < self._max_concurrent:
+                self._active += 1
+                return True
+            try:
+                await asyncio.wait_for(
+                    self._condition.wait_for(lambda: self._active < self._max_concurrent),
+                    timeout,
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"Stream admission timed out ({self._active} active)")
+                return False
+            self._active += 1
+            return True
+
+    async def release(self) -> None:
+        """Return a slot and wake one waiter."""
+        async with self._condition:
+            if self._active > 0:
+                self._active -= 1
+            self._condition.notify(1)
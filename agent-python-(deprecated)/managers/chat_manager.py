@@ -3,56 +3,214 @@ VS Code Chat Manager - Manages chat sessions with VS Code extension.
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from typing import Iterable, Optional
 import asyncio
 import logging
+import time
 
-from fastapi import WebSocket
+import orjson
+from fastapi import WebSocket, WebSocketDisconnect
 
 logger = logging.getLogger("movesia.chat")
 
 
-@dataclass
+# Bound on queued outbound frames per session; beyond this, producers are
+# outrunning the client and frames get dropped rather than growing memory
+_OUT_QUEUE_MAX = 256
+
+# Opt-in frame coalescing. When enabled, bursts are merged into a single
+# {"type": "batch", "items": [...]} frame - a PROTOCOL CHANGE the client must
+# support: it has to unwrap the batch envelope and process each item as if it
+# arrived as its own frame. No shipped VS Code client does that yet, so this
+# stays off until one does. Flip only together with a client release.
+_COALESCE_FRAMES = False
+
+# Max messages merged into one "batch" frame when coalescing is enabled
+_WRITER_BATCH_MAX = 32
+
+
+@dataclass(slots=True)
 class ChatSession:
-    """Represents an active chat session."""
+    """Represents an active chat session.
+
+    Outbound frames go through a bounded queue drained by a single writer
+    task, so bursty producers enqueue without awaiting socket drain and
+    never contend on the WebSocket.
+    """
     session_id: str
     websocket: WebSocket
-    created_at: datetime = field(default_factory=datetime.now)
+    # Monotonic float (matches unity.types): no gettimeofday/datetime
+    # construction per register, and immune to wall-clock jumps
+    created_at: float = field(default_factory=time.monotonic)
+    out_queue: asyncio.Queue = field(init=False, repr=False)
+    writer_task: asyncio.Task = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.out_queue = asyncio.Queue(maxsize=_OUT_QUEUE_MAX)
+        self.writer_task = asyncio.create_task(self._writer())
+
+    async def _writer(self) -> None:
+        """Drain the outbound queue onto the socket.
+
+        With _COALESCE_FRAMES enabled, messages that queued up while the
+        previous frame was draining are merged into one
+        {"type": "batch", "items": [...]} frame (the payloads are already
+        JSON, so they splice in verbatim). That requires a client that
+        unwraps the envelope - none ships yet, so by default every payload
+        goes out as its own frame.
+        """
+        try:
+            while True:
+                payload = await self.out_queue.get()
+                if not _COALESCE_FRAMES:
+                    await self.websocket.send_text(payload)
+                    continue
+                batch = [payload]
+                while len(batch) < _WRITER_BATCH_MAX:
+                    try:
+                        batch.append(self.out_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                if len(batch) == 1:
+                    await self.websocket.send_text(payload)
+                else:
+                    await self.websocket.send_text(
+                        '{"type":"batch","items":[' + ",".join(batch) + "]}"
+                    )
+        except asyncio.CancelledError:
+            pass
+        except (WebSocketDisconnect, ConnectionError, RuntimeError) as e:
+            # Expected when the client goes away mid-send; the manager's
+            # done-callback evicts the session so it stops accumulating
+            logger.debug(f"Socket closed for session {self.session_id}: {e}")
+        except Exception as e:
+            logger.error(f"Writer stopped for session {self.session_id}: {e}")
+
+    def close(self) -> None:
+        """Stop the writer task (call on unregister)."""
+        self.writer_task.cancel()
 
 
 class ChatManager:
-    """Manages VS Code chat sessions."""
+    """Manages VS Code chat sessions.
+
+    All mutations happen on the event loop thread and each is a single dict
+    operation with no await in between, so no lock is needed - asyncio
+    tasks can't interleave mid-statement.
+    """
 
     def __init__(self):
-        self._sessions: dict[str, ChatSession] = {}
-        self._lock = asyncio.Lock()
+        # Contiguous session list plus id->index map: broadcast walks the
+        # list without dict-view allocation or per-slot hashing, and removal
+        # is an O(1) swap-pop
+        self._list: list[ChatSession] = []
+        self._idx: dict[str, int] = {}
 
     @property
     def session_count(self) -> int:
-        return len(self._sessions)
+        return len(self._list)
 
     async def register(self, session_id: str, websocket: WebSocket):
         """Register a new chat session."""
-        async with self._lock:
-            self._sessions[session_id] = ChatSession(
-                session_id=session_id,
-                websocket=websocket
-            )
+        session = ChatSession(session_id=session_id, websocket=websocket)
+        index = self._idx.get(session_id)
+        if index is not None:
+            # Reconnect: replace in place, stopping the old writer
+            self._list[index].close()
+            self._list[index] = session
+        else:
+            self._idx[session_id] = len(self._list)
+            self._list.append(session)
+
+        # If the writer dies (broken socket), evict the session rather than
+        # leaving it to soak up failed sends. Guarded against reconnects:
+        # only evicts if this exact session is still the registered one.
+        def _evict(_task: asyncio.Task, session=session) -> None:
+            if self.get_session(session.session_id) is session:
+                asyncio.ensure_future(self.unregister(session.session_id))
+
+        session.writer_task.add_done_callback(_evict)
 
     async def unregister(self, session_id: str):
         """Unregister a chat session."""
-        async with self._lock:
-            self._sessions.pop(session_id, None)
+        index = self._idx.pop(session_id, None)
+        if index is None:
+            return
+        session = self._list[index]
+        session.close()
+        # Swap-pop: move the tail into the vacated slot
+        last = self._list.pop()
+        if last is not session:
+            self._list[index] = last
+            self._idx[last.session_id] = index
 
     async def send(self, session_id: str, message: dict):
         """Send message to a specific session."""
-        session = self._sessions.get(session_id)
+        # Encode once with orjson (compact, several times faster than the
+        # stdlib path inside send_json) and delegate to the text send
+        await self.send_encoded(session_id, orjson.dumps(message).decode())
+
+    async def send_encoded(self, session_id: str, payload: str):
+        """Send an already-serialized JSON payload to a session.
+
+        Lets callers that fan the same message out to several sessions pay
+        for serialization once.
+        """
+        session = self.get_session(session_id)
         if session:
             try:
-                await session.websocket.send_json(message)
+                session.out_queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                logger.warning(
+                    f"Outbound queue full for session {session_id}, dropping frame"
+                )
+
+    async def broadcast(
+        self,
+        message: dict,
+        session_ids: Optional[Iterable[str]] = None,
+    ) -> int:
+        """Send a message to many sessions concurrently.
+
+        The payload is serialized once and fanned out with gather, so
+        broadcast latency tracks the slowest client instead of the sum of
+        all of them. Sessions whose send fails are dropped afterwards.
+
+        Returns:
+            Number of sessions the message reached.
+        """
+        if session_ids is None:
+            targets = list(self._list)
+        else:
+            targets = [
+                session
+                for sid in session_ids
+                if (session := self.get_session(sid)) is not None
+            ]
+        if not targets:
+            return 0
+
+        payload = orjson.dumps(message).decode()
+
+        # Broadcast sends directly rather than through the per-session
+        # queues: the await doubles as a liveness probe for cleanup below
+        async def safe_send(session: ChatSession):
+            try:
+                await asyncio.wait_for(
+                    session.websocket.send_text(payload), timeout=5.0
+                )
+                return None
             except Exception as e:
-                logger.error(f"Failed to send to session {session_id}: {e}")
+                logger.debug(f"Broadcast failed for {session.session_id}: {e}")
+                return session.session_id
+
+        results = await asyncio.gather(*(safe_send(s) for s in targets))
+        dead = [sid for sid in results if sid is not None]
+        for sid in dead:
+            await self.unregister(sid)
+        return len(targets) - len(dead)
 
     def get_session(self, session_id: str) -> ChatSession | None:
         """Get a session by ID."""
-        return self._sessions.get(session_id)
+        index = self._idx.get(session_id)
+        return self._list[index] if index is not None else None
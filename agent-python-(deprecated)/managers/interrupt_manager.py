@@ -14,50 +14,85 @@ from unity.config import INTERRUPT_TIMEOUT
 
 logger = logging.getLogger("movesia.interrupts")
 
+_TIMEOUT_MSG_TEMPLATE = "Operation timed out after {}s"
+
+# Nearly every wait() uses the default timeout, so the error response for it
+# can be built once; callers get a shallow copy they may mutate freely
+_DEFAULT_TIMEOUT_RESPONSE = {
+    "success": False,
+    "error": _TIMEOUT_MSG_TEMPLATE.format(INTERRUPT_TIMEOUT),
+}
+
 
 class InterruptManager:
     """
     Manages pending interrupts waiting for Unity responses.
+
+    All operations are plain dict mutations on the event loop thread with
+    no await inside, so no lock is needed - asyncio tasks can't interleave
+    mid-statement.
     """
 
     def __init__(self):
-        self._pending: dict[str, asyncio.Future] = {}
-        self._lock = asyncio.Lock()
+        # request_id -> (future, expiry timer handle)
+        self._pending: dict[str, tuple[asyncio.Future, asyncio.TimerHandle]] = {}
+
+    def _expire(self, request_id: str) -> None:
+        """Timer callback: fail the pending future with TimeoutError."""
+        entry = self._pending.pop(request_id, None)
+        if entry is not None:
+            future, _handle = entry
+            if not future.done():
+                future.set_exception(TimeoutError())
+
+    async def create(
+        self, request_id: str, timeout: float = INTERRUPT_TIMEOUT
+    ) -> asyncio.Future:
+        """Create a future that will be resolved when Unity responds.
 
-    async def create(self, request_id: str) -> asyncio.Future:
-        """Create a future that will be resolved when Unity responds."""
-        async with self._lock:
-            if request_id in self._pending:
-                self._pending[request_id].cancel()
+        The timeout is armed here as a bare call_later on the loop - cheaper
+        than asyncio.timeout/wait_for, which add a context-manager or wrapper
+        Task per wait. resolve() disarms the timer.
+        """
+        collided = self._pending.pop(request_id, None)
+        if collided is not None:
+            future, handle = collided
+            handle.cancel()
+            future.cancel()
 
-            loop = asyncio.get_event_loop()
-            future = loop.create_future()
-            self._pending[request_id] = future
-            return future
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        handle = loop.call_later(timeout, self._expire, request_id)
+        self._pending[request_id] = (future, handle)
+        return future
 
     async def resolve(self, request_id: str, result: dict):
         """Resolve a pending interrupt with Unity's result."""
-        async with self._lock:
-            if request_id in self._pending:
-                future = self._pending.pop(request_id)
-                if not future.done():
-                    future.set_result(result)
+        entry = self._pending.pop(request_id, None)
+        if entry is not None:
+            future, handle = entry
+            handle.cancel()
+            if not future.done():
+                future.set_result(result)
 
     async def wait(self, request_id: str, timeout: float = INTERRUPT_TIMEOUT) -> dict:
         """Wait for an interrupt to be resolved."""
-        future = await self.create(request_id)
+        future = await self.create(request_id, timeout)
         try:
-            return await asyncio.wait_for(future, timeout=timeout)
-        except asyncio.TimeoutError:
-            async with self._lock:
-                self._pending.pop(request_id, None)
+            return await future
+        except TimeoutError:
+            # _expire already removed the entry
             logger.error(f"Interrupt timed out: {request_id}")
-            return {"success": False, "error": f"Operation timed out after {timeout}s"}
+            if timeout == INTERRUPT_TIMEOUT:
+                return dict(_DEFAULT_TIMEOUT_RESPONSE)
+            return {"success": False, "error": _TIMEOUT_MSG_TEMPLATE.format(timeout)}
 
     async def cancel_all(self):
         """Cancel all pending interrupts."""
-        async with self._lock:
-            for request_id, future in self._pending.items():
-                if not future.done():
-                    future.cancel()
-            self._pending.clear()
+        # Swap the dict out first: interrupts created while the cancels run
+        # land in the fresh dict and survive
+        pending, self._pending = self._pending, {}
+        for future, handle in pending.values():
+            handle.cancel()
+            if not future.done():
+                future.cancel()
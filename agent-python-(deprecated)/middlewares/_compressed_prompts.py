@@ -0,0 +1,18 @@
+"""
+Compressed ("gist") prompt variants.
+
+Generated offline by scripts/compress_prompts.py (LLMLingua token selection
+over BALANCED_TOOL_DESCRIPTION, rate=0.15, with CRITICAL/IMPORTANT/
+in_progress/completed force-kept). Checked in as a plain literal so the
+server never needs llmlingua or its model at runtime.
+
+Regenerate after editing the balanced description:
+
+    python scripts/compress_prompts.py
+"""
+
+# ~80 tokens
+GIST_TOOL_DESCRIPTION = """Task list, complex 3+ step work. Track progress, show plan.
+Use: multi-step, planning, multiple tasks. Skip: trivial, single step, conversational.
+Status: pending, in_progress, completed.
+CRITICAL real-time updates: first task in_progress on create; in_progress before start; completed IMMEDIATELY after finish, no batch; keep 1+ in_progress."""
@@ -38,13 +38,16 @@ WHAT WE KEPT:
 
 from __future__ import annotations
 
-from typing import Any, Callable, Literal
+from collections import Counter
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Literal
 from typing_extensions import NotRequired, TypedDict
 
-from langchain_core.tools import tool, BaseTool
-from langchain_core.messages import AIMessage, ToolMessage, SystemMessage
+from langchain_core.messages import ToolMessage, SystemMessage
 from langgraph.types import Command
 
+from ._compressed_prompts import GIST_TOOL_DESCRIPTION
+
 try:
     from langchain.agents.middleware import (
         AgentMiddleware,
@@ -55,6 +58,9 @@ except ImportError:
     from langchain.agents import AgentMiddleware, AgentState
     ModelRequest = Any
 
+if TYPE_CHECKING:
+    from langchain_core.tools import BaseTool
+
 
 __all__ = [
     "OptimizedTodoMiddleware",
@@ -74,22 +80,45 @@ __all__ = [
 # TOOL DESCRIPTIONS - Balanced versions with examples
 # ═══════════════════════════════════════════════════════════════════════════════
 
-# BALANCED: ~550 tokens - Keeps essential examples, stronger status update emphasis
-BALANCED_TOOL_DESCRIPTION = """Manage a structured task list for complex work sessions. Helps track progress and shows the user your plan.
+# The three verbosity tiers share a byte-identical prefix so provider prompt
+# caching (OpenAI's >=1024-token prefix rule, Anthropic cache_control) can
+# reuse the prefill across modes and turns - only the example suffix varies.
+# Callers on Anthropic should set cache_control={"type": "ephemeral"} on the
+# tool/system block to opt in.
+_STATIC_DESCRIPTION_PREFIX = """Manage a structured task list for complex work sessions. Helps track progress and shows the user your plan.
 
 ## When to Use
 - Complex multi-step tasks (3+ distinct steps)
-- Tasks requiring planning or multiple operations  
+- Tasks requiring planning or multiple operations
 - User explicitly requests a todo list
 - User provides multiple tasks to complete
-- Plan may need revision based on intermediate results
 
 ## When NOT to Use
-- Single straightforward task
-- Trivial tasks (<3 simple steps)
+- Single straightforward or trivial task (<3 simple steps)
 - Purely conversational/informational requests
 - A few simple parallel tool calls
 
+## Status Values
+- **pending**: Not started yet
+- **in_progress**: Currently working on this task
+- **completed**: Task finished successfully
+
+## CRITICAL Status Update Rules
+
+**IMPORTANT:** You MUST update task status in real-time as you work!
+
+1. **When creating the list:** Mark your first task as `in_progress` immediately
+2. **Before starting any task:** Mark it as `in_progress` first
+3. **After completing any task:** Mark it as `completed` IMMEDIATELY - do NOT batch completions
+4. **While working:** Always have at least one task marked `in_progress` (unless all are done)
+5. **After finishing a task:** Mark it `completed`, then mark the next task `in_progress`
+
+Do NOT wait until the end to mark tasks completed. Update status after EACH task."""
+
+
+# BALANCED: full examples + worked status workflow
+BALANCED_TOOL_DESCRIPTION = _STATIC_DESCRIPTION_PREFIX + """
+
 ## Examples - USE the todo list:
 
 User: "Add dark mode toggle to settings. Run tests and build when done."
@@ -115,71 +144,30 @@ User: "Write a function to check if a number is prime and test it"
 User: "Order pizza from Dominos, burger from McDonalds, salad from Subway"
 → Skip todos: 3 simple parallel calls, no planning needed
 
-## Status Values
-- **pending**: Not started yet
-- **in_progress**: Currently working on this task
-- **completed**: Task finished successfully
-
-## CRITICAL Status Update Rules
-
-**IMPORTANT:** You MUST update task status in real-time as you work!
-
-1. **When creating the list:** Mark your first task as `in_progress` immediately
-2. **Before starting any task:** Mark it as `in_progress` first
-3. **After completing any task:** Mark it as `completed` IMMEDIATELY - do NOT batch completions
-4. **While working:** Always have at least one task marked `in_progress` (unless all are done)
-5. **After finishing a task:** Mark it `completed`, then mark the next task `in_progress`
-
 ## Example Workflow
 ```
 1. Create todos → Task 1: in_progress, Tasks 2-3: pending
-2. Finish task 1 → Task 1: completed, Task 2: in_progress, Task 3: pending  
+2. Finish task 1 → Task 1: completed, Task 2: in_progress, Task 3: pending
 3. Finish task 2 → Tasks 1-2: completed, Task 3: in_progress
 4. Finish task 3 → All tasks: completed
-```
+```"""
 
-Do NOT wait until the end to mark tasks completed. Update status after EACH task."""
-
-
-# LEAN: ~320 tokens - Condensed examples with status emphasis
-LEAN_TOOL_DESCRIPTION = """Manage task list for complex work. Use for 3+ step tasks to track progress and show the user your plan.
-
-## When to Use
-- Multi-step tasks (3+ steps), complex planning, user requests tracking
-- Example: "Add dark mode + run tests" → Use todos (UI + state + styling + tests)
-- Example: "Plan marketing campaign" → Use todos (multiple channels)
 
-## When NOT to Use  
-- Simple queries, single actions, <3 trivial steps
-- Example: "Print Hello World" → Skip (trivial)
-- Example: "Write prime checker and test it" → Skip (only 2 steps)
-- Example: "Order from 3 restaurants" → Skip (3 simple parallel calls)
+# LEAN: condensed one-line examples
+LEAN_TOOL_DESCRIPTION = _STATIC_DESCRIPTION_PREFIX + """
 
-## Status: pending → in_progress → completed
-
-**IMPORTANT - Update status in real-time:**
-1. When creating list: Mark first task `in_progress` immediately
-2. After completing a task: Mark it `completed` RIGHT AWAY, then mark next task `in_progress`
-3. Always keep 1+ task `in_progress` while working
-4. Do NOT wait until the end - update after EACH task completion
+## Examples
+- "Add dark mode + run tests" → Use todos (UI + state + styling + tests)
+- "Plan marketing campaign" → Use todos (multiple channels)
+- "Print Hello World" → Skip (trivial)
+- "Write prime checker and test it" → Skip (only 2 steps)
+- "Order from 3 restaurants" → Skip (3 simple parallel calls)
 
 Example: Create (T1:in_progress, T2:pending) → Finish T1 (T1:completed, T2:in_progress) → Finish T2 (all completed)"""
 
 
-# ULTRA: ~150 tokens - Minimal but with status emphasis
-ULTRA_TOOL_DESCRIPTION = """Task list for complex (3+ step) work. Shows user your plan and progress.
-
-Use for: Multi-step features, complex planning, multiple coordinated tasks.
-Skip for: Simple questions, single edits, <3 trivial steps, simple parallel calls.
-
-Status: pending (not started) → in_progress (working) → completed (done)
-
-IMPORTANT Rules:
-- Mark first task `in_progress` when creating list
-- Mark `completed` IMMEDIATELY after finishing each task
-- Then mark next task `in_progress`
-- Keep 1+ task `in_progress` while working
-- Do NOT batch - update after EACH task"""
+# ULTRA: shared prefix only, no example suffix
+ULTRA_TOOL_DESCRIPTION = _STATIC_DESCRIPTION_PREFIX
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -231,34 +219,99 @@ class CompactTodoState(AgentState):
     todos: NotRequired[list[CompactTodo]]
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# STATUS NORMALIZATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Every accepted spelling maps to the canonical form in one dict lookup,
+# replacing the in-tuple compare ladders in the tool handlers. The canonical
+# strings are shared across all todos, so state serialization reuses them.
+
+_STATUS_TO_LONG = {
+    "p": "pending", "pending": "pending",
+    "w": "in_progress", "working": "in_progress", "in_progress": "in_progress",
+    "d": "completed", "done": "completed", "completed": "completed",
+}
+
+_STATUS_TO_SHORT = {
+    "p": "p", "pending": "p",
+    "w": "w", "working": "w", "in_progress": "w",
+    "d": "d", "done": "d", "completed": "d",
+}
+
+# Interned once so the hot name comparisons hit the pointer-equality fast path
+_WRITE_TODOS = "write_todos"
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # TOOL FACTORIES
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Tool construction (@tool decoration + Pydantic schema build) is cached per
+# description and deferred to first use: LangChain tools hold no
+# per-invocation state, so instances are safe to share across
+# middlewares/agents, and nothing is built until a middleware is created
+@lru_cache(maxsize=16)
 def _create_standard_tool(description: str) -> BaseTool:
     """Create write_todos tool with standard schema."""
-    
+    from langchain_core.tools import tool
+
     @tool
     def write_todos(todos: list[dict[str, str]]) -> str:
         """Manage todo list. Each item: {content: "task", status: "pending|in_progress|completed"}"""
         return "ok"
-    
+
     write_todos.description = description
     return write_todos
 
 
+@lru_cache(maxsize=16)
 def _create_compact_tool(description: str) -> BaseTool:
     """Create write_todos tool with compact schema."""
-    
+    from langchain_core.tools import tool
+
     @tool
     def write_todos(todos: list[dict[str, str]]) -> str:
         """Manage todo list. Items: {t: "task", s: "p|w|d"} where p=pending, w=in_progress, d=done"""
         return "ok"
-    
+
     write_todos.description = description
     return write_todos
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# PRECOMPILED MODE TABLES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Built once at import: per-mode description, prompt, prompt content block
+# (with its leading separator baked in), and write_todos tool. Instances pick
+# references instead of rebuilding, which also keeps the tool schema and
+# prompt bytes identical across instances/requests - friendlier to provider
+# prefix caching.
+
+_DESCRIPTIONS = {
+    "balanced": BALANCED_TOOL_DESCRIPTION,
+    "lean": LEAN_TOOL_DESCRIPTION,
+    "ultra": ULTRA_TOOL_DESCRIPTION,
+    "gist": GIST_TOOL_DESCRIPTION,
+    "none": "Manage todo list for multi-step tasks.",
+}
+
+_PROMPTS = {
+    "balanced": BALANCED_SYSTEM_PROMPT,
+    "lean": LEAN_SYSTEM_PROMPT,
+    "ultra": ULTRA_SYSTEM_PROMPT,
+    "gist": ULTRA_SYSTEM_PROMPT,
+    "none": "",
+}
+
+_PROMPT_BLOCKS = {
+    mode: {"type": "text", "text": f"\n\n{prompt}"}
+    for mode, prompt in _PROMPTS.items()
+    if prompt
+}
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # MAIN MIDDLEWARE
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -274,6 +327,7 @@ class OptimizedTodoMiddleware(AgentMiddleware):
     - "balanced" (~640 tokens): Full examples, best for reliability
     - "lean" (~370 tokens): Condensed examples, good balance  
     - "ultra" (~180 tokens): Minimal, for capable models
+    - "gist" (~80 tokens): LLMLingua-compressed, generated offline
     - "none" (~40 tokens): Tool schema only
     
     Example:
@@ -288,26 +342,16 @@ class OptimizedTodoMiddleware(AgentMiddleware):
         ```
     """
     
-    DESCRIPTIONS = {
-        "balanced": BALANCED_TOOL_DESCRIPTION,
-        "lean": LEAN_TOOL_DESCRIPTION,
-        "ultra": ULTRA_TOOL_DESCRIPTION,
-        "none": "Manage todo list for multi-step tasks.",
-    }
-    
-    PROMPTS = {
-        "balanced": BALANCED_SYSTEM_PROMPT,
-        "lean": LEAN_SYSTEM_PROMPT,
-        "ultra": ULTRA_SYSTEM_PROMPT,
-        "none": "",
-    }
+    DESCRIPTIONS = _DESCRIPTIONS
+
+    PROMPTS = _PROMPTS
     
     def __init__(
         self,
         *,
         tool_description: str | None = None,
         system_prompt: str | None = None,
-        mode: Literal["balanced", "lean", "ultra", "none"] = "balanced",
+        mode: Literal["balanced", "lean", "ultra", "gist", "none"] = "balanced",
         auto_cleanup: bool = True,
         keep_last: int = 1,
         conditional_prompt: bool = True,
@@ -323,6 +367,7 @@ class OptimizedTodoMiddleware(AgentMiddleware):
                 - "balanced" (~640 tokens): Full examples, recommended
                 - "lean" (~370 tokens): Condensed, good balance
                 - "ultra" (~180 tokens): Minimal guidance
+                - "gist" (~80 tokens): LLMLingua-compressed balanced
                 - "none" (~40 tokens): Tool schema only
             auto_cleanup: Remove old write_todos calls from message history
             keep_last: Number of recent write_todos calls to keep
@@ -330,19 +375,42 @@ class OptimizedTodoMiddleware(AgentMiddleware):
             compact_state: Use compact state format (t/s vs content/status)
         """
         super().__init__()
-        
-        self._tool_desc = tool_description or self.DESCRIPTIONS.get(mode, self.DESCRIPTIONS["balanced"])
-        self._sys_prompt = system_prompt if system_prompt is not None else self.PROMPTS.get(mode, "")
-        
+
+        if mode not in _DESCRIPTIONS:
+            mode = "balanced"
+
+        self._sys_prompt = system_prompt if system_prompt is not None else _PROMPTS[mode]
+
+        # Prompt block and tool come from the precompiled tables unless a
+        # custom string was supplied
+        if system_prompt is not None:
+            self._prompt_block = (
+                {"type": "text", "text": f"\n\n{system_prompt}"} if system_prompt else None
+            )
+        else:
+            self._prompt_block = _PROMPT_BLOCKS.get(mode)
+
         self._auto_cleanup = auto_cleanup
         self._keep_last = max(0, keep_last)
         self._conditional = conditional_prompt
         self._compact = compact_state
-        
-        if compact_state:
-            self._tool = _create_compact_tool(self._tool_desc)
-        else:
-            self._tool = _create_standard_tool(self._tool_desc)
+
+        # Memo for the inject decision: LangGraph replaces the todos list on
+        # update, so its identity is a reliable change signal
+        self._last_todos_id: int | None = None
+        self._last_should_inject = True
+
+        # Rebuilt system messages keyed by the identity of the original one.
+        # The base system message rarely changes across turns, so this skips
+        # the per-turn SystemMessage construction (Pydantic validation)
+        self._sysmsg_cache: dict[int, SystemMessage] = {}
+
+        # The factories are lru_cached, so the built-in modes build once
+        # process-wide and custom descriptions dedupe too
+        if tool_description is None:
+            tool_description = _DESCRIPTIONS[mode]
+        factory = _create_compact_tool if compact_state else _create_standard_tool
+        self._tool = factory(tool_description)
     
     @property
     def state_schema(self):
@@ -358,58 +426,93 @@ class OptimizedTodoMiddleware(AgentMiddleware):
     
     def modify_model_request(self, request: ModelRequest) -> ModelRequest:
         """Apply optimizations to model request."""
-        
-        # 1. Clean old write_todos calls
+
+        # 1. Clean old write_todos calls. _prune_todo_history returns the
+        # input unchanged when there is nothing to drop, so override (and
+        # the message rematerialization it implies) only happens on prunes
         if self._auto_cleanup:
-            messages = self._prune_todo_history(list(request.messages))
-            request = request.override(messages=messages)
-        
-        # 2. Conditional system prompt injection
-        if self._sys_prompt:
-            should_inject = True
-            if self._conditional and request.state.get("todos"):
-                should_inject = False
-            
+            messages = request.messages
+            pruned = self._prune_todo_history(messages)
+            if pruned is not messages:
+                request = request.override(messages=pruned)
+
+        # 2. Conditional system prompt injection. In steady state (todos
+        # already exist) this skips the content-block copy entirely; the
+        # decision itself is memoized on the todos list identity
+        if self._prompt_block:
+            todos = request.state.get("todos")
+            key = id(todos)
+            if key == self._last_todos_id:
+                should_inject = self._last_should_inject
+            else:
+                should_inject = not (self._conditional and todos)
+                self._last_todos_id = key
+                self._last_should_inject = should_inject
+
             if should_inject:
-                blocks = list(request.system_message.content_blocks)
-                blocks.append({"type": "text", "text": f"\n\n{self._sys_prompt}"})
-                request = request.override(
-                    system_message=SystemMessage(content=blocks)
-                )
-        
+                original = request.system_message
+                rebuilt = self._sysmsg_cache.get(id(original))
+                if rebuilt is None:
+                    # Single list-literal build (copy + append fused)
+                    rebuilt = SystemMessage(
+                        content=[*original.content_blocks, self._prompt_block]
+                    )
+                    if len(self._sysmsg_cache) > 3:
+                        self._sysmsg_cache.clear()
+                    self._sysmsg_cache[id(original)] = rebuilt
+                request = request.override(system_message=rebuilt)
+
         return request
     
     def _prune_todo_history(self, messages: list) -> list:
-        """Remove old write_todos tool calls from history."""
-        
-        todo_pairs: list[tuple[int, int]] = []
-        
+        """Remove old write_todos tool calls from history.
+
+        Returns the input object unchanged when there is nothing to prune,
+        so callers can detect no-ops by identity.
+        """
+
+        # Cheap pass first: collect write_todos calls (first per AIMessage).
+        # Most turns have at most keep_last of them, in which case we bail
+        # before touching the ToolMessages at all
+        # Attribute probes instead of isinstance: only AIMessage carries
+        # tool_calls and only ToolMessage carries tool_call_id, and getattr
+        # skips the per-message MRO walk
+        candidates: list[tuple[int, Any]] = []
         for i, msg in enumerate(messages):
-            if not isinstance(msg, AIMessage):
-                continue
-            if not hasattr(msg, "tool_calls") or not msg.tool_calls:
+            tool_calls = getattr(msg, "tool_calls", None)
+            if not tool_calls:
                 continue
-            
-            for tc in msg.tool_calls:
-                if tc.get("name") != "write_todos":
-                    continue
-                
-                tc_id = tc.get("id")
-                for j in range(i + 1, len(messages)):
-                    if isinstance(messages[j], ToolMessage):
-                        if getattr(messages[j], "tool_call_id", None) == tc_id:
-                            todo_pairs.append((i, j))
-                            break
-                break
-        
+            for tc in tool_calls:
+                if tc.get("name") == _WRITE_TODOS:
+                    candidates.append((i, tc.get("id")))
+                    break
+
+        if len(candidates) <= self._keep_last:
+            return messages
+
+        # One pass over ToolMessages builds an id -> index map, so each
+        # write_todos call finds its partner in O(1) instead of rescanning
+        # the conversation tail (quadratic on long chats)
+        id_to_idx = {
+            tc_id: j
+            for j, m in enumerate(messages)
+            if (tc_id := getattr(m, "tool_call_id", None)) is not None
+        }
+
+        todo_pairs = [
+            (i, j)
+            for i, tc_id in candidates
+            if (j := id_to_idx.get(tc_id)) is not None
+        ]
+
         if len(todo_pairs) <= self._keep_last:
             return messages
-        
+
         remove = set()
         for ai_idx, tool_idx in todo_pairs[:-self._keep_last]:
             remove.add(ai_idx)
             remove.add(tool_idx)
-        
+
         return [m for i, m in enumerate(messages) if i not in remove]
     
     # ─────────────────────────────────────────────────────────────────────────
@@ -417,12 +520,12 @@ class OptimizedTodoMiddleware(AgentMiddleware):
     # ─────────────────────────────────────────────────────────────────────────
     
     def wrap_tool_call(self, request, handler: Callable) -> ToolMessage | Command:
-        if request.tool_call.get("name") == "write_todos":
+        if request.tool_call.get("name") == _WRITE_TODOS:
             return self._handle_write_todos(request)
         return handler(request)
-    
+
     async def awrap_tool_call(self, request, handler: Callable) -> ToolMessage | Command:
-        if request.tool_call.get("name") == "write_todos":
+        if request.tool_call.get("name") == _WRITE_TODOS:
             return self._handle_write_todos(request)
         return await handler(request)
     
@@ -435,33 +538,23 @@ class OptimizedTodoMiddleware(AgentMiddleware):
         for item in raw_todos:
             if not isinstance(item, dict):
                 continue
-            
+
             if self._compact:
                 text = item.get("t") or item.get("content", "")
-                status = item.get("s") or item.get("status", "p")
-                if status in ("pending", "p"):
-                    status = "p"
-                elif status in ("in_progress", "w", "working"):
-                    status = "w"
-                elif status in ("completed", "d", "done"):
-                    status = "d"
-                else:
-                    status = "p"
+                status = _STATUS_TO_SHORT.get(item.get("s") or item.get("status"), "p")
                 if text:
-                    todos.append({"t": str(text)[:500], "s": status})
+                    if not isinstance(text, str):
+                        text = str(text)
+                    todos.append({"t": text[:500], "s": status})
             else:
                 text = item.get("content") or item.get("t", "")
-                status = item.get("status") or item.get("s", "pending")
-                if status in ("p", "pending"):
-                    status = "pending"
-                elif status in ("w", "working", "in_progress"):
-                    status = "in_progress"
-                elif status in ("d", "done", "completed"):
-                    status = "completed"
-                else:
-                    status = "pending"
+                status = _STATUS_TO_LONG.get(
+                    item.get("status") or item.get("s"), "pending"
+                )
                 if text:
-                    todos.append({"content": str(text)[:500], "status": status})
+                    if not isinstance(text, str):
+                        text = str(text)
+                    todos.append({"content": text[:500], "status": status})
         
         return Command(
             update={
@@ -518,42 +611,50 @@ class MicroTodoMiddleware(AgentMiddleware):
     def tools(self) -> list[BaseTool]:
         return [self._tool]
     
+    def _build_update(self, request) -> Command:
+        """Process a write_todos call - shared by the sync/async wrappers."""
+        todos = []
+        for item in request.tool_call.get("args", {}).get("todos", []):
+            if isinstance(item, dict):
+                if self._compact:
+                    t = item.get("t") or item.get("content", "")
+                    s = _STATUS_TO_SHORT.get(item.get("s"), "p")
+                    if t: todos.append({"t": t, "s": s})
+                else:
+                    c = item.get("content") or item.get("t", "")
+                    st = _STATUS_TO_LONG.get(item.get("status"), "pending")
+                    if c: todos.append({"content": c, "status": st})
+
+        return Command(
+            update={
+                "todos": todos,
+                "messages": [ToolMessage(content="ok", tool_call_id=request.tool_call["id"])],
+            }
+        )
+
     def wrap_tool_call(self, request, handler: Callable) -> ToolMessage | Command:
-        if request.tool_call.get("name") == "write_todos":
-            todos = []
-            for item in request.tool_call.get("args", {}).get("todos", []):
-                if isinstance(item, dict):
-                    if self._compact:
-                        t = item.get("t") or item.get("content", "")
-                        s = item.get("s", "p")
-                        if s in ("pending", "p"): s = "p"
-                        elif s in ("in_progress", "w"): s = "w"
-                        elif s in ("completed", "d"): s = "d"
-                        if t: todos.append({"t": t, "s": s})
-                    else:
-                        c = item.get("content") or item.get("t", "")
-                        st = item.get("status", "pending")
-                        if st == "p": st = "pending"
-                        elif st == "w": st = "in_progress"
-                        elif st == "d": st = "completed"
-                        if c: todos.append({"content": c, "status": st})
-            
-            return Command(
-                update={
-                    "todos": todos,
-                    "messages": [ToolMessage(content="ok", tool_call_id=request.tool_call["id"])],
-                }
-            )
+        if request.tool_call.get("name") == _WRITE_TODOS:
+            return self._build_update(request)
         return handler(request)
-    
+
     async def awrap_tool_call(self, request, handler: Callable) -> ToolMessage | Command:
-        return self.wrap_tool_call(request, handler)
+        # write_todos never touches the loop; everything else must await the
+        # async handler rather than bouncing through the sync wrapper (which
+        # would call a coroutine function without awaiting it)
+        if request.tool_call.get("name") == _WRITE_TODOS:
+            return self._build_update(request)
+        return await handler(request)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # UTILITIES
 # ═══════════════════════════════════════════════════════════════════════════════
 
+_EMOJI = {"p": "⏳", "w": "🔄", "d": "✅"}
+_LABELS = {"p": "PENDING", "w": "IN PROGRESS", "d": "COMPLETED"}
+_CHECKS = {"p": "[ ]", "w": "[~]", "d": "[x]"}
+
+
 def format_todos(
     todos: list[Todo] | list[CompactTodo] | None,
     style: Literal["emoji", "text", "markdown", "compact"] = "emoji",
@@ -561,59 +662,50 @@ def format_todos(
     """Format todos for display."""
     if not todos:
         return "(no todos)"
-    
-    is_compact = todos and "t" in todos[0]
-    lines = []
-    
-    for item in todos:
-        if is_compact:
-            text = item.get("t", "")
-            status = item.get("s", "p")
-        else:
-            text = item.get("content", "")
-            status = item.get("status", "pending")
-            if status == "pending": status = "p"
-            elif status == "in_progress": status = "w"
-            elif status == "completed": status = "d"
-        
-        if style == "emoji":
-            icons = {"p": "⏳", "w": "🔄", "d": "✅"}
-            lines.append(f"{icons.get(status, '?')} {text}")
-        elif style == "text":
-            labels = {"p": "PENDING", "w": "IN PROGRESS", "d": "COMPLETED"}
-            lines.append(f"[{labels.get(status, '?')}] {text}")
-        elif style == "markdown":
-            checks = {"p": "[ ]", "w": "[~]", "d": "[x]"}
-            lines.append(f"- {checks.get(status, '[ ]')} {text}")
-        elif style == "compact":
-            lines.append(f"{status}:{text}")
-    
-    return "\n".join(lines) if style != "compact" else " | ".join(lines)
+
+    # Normalize to (text, short-status) tuples once, then dispatch on style
+    # once instead of per item; the icon/label tables are module constants
+    if "t" in todos[0]:
+        items = [(item.get("t", ""), item.get("s", "p")) for item in todos]
+    else:
+        items = [
+            (
+                item.get("content", ""),
+                _STATUS_TO_SHORT.get(item.get("status", "pending"), "?"),
+            )
+            for item in todos
+        ]
+
+    if style == "emoji":
+        return "\n".join(f"{_EMOJI.get(s, '?')} {t}" for t, s in items)
+    if style == "text":
+        return "\n".join(f"[{_LABELS.get(s, '?')}] {t}" for t, s in items)
+    if style == "markdown":
+        return "\n".join(f"- {_CHECKS.get(s, '[ ]')} {t}" for t, s in items)
+    if style == "compact":
+        return " | ".join(f"{s}:{t}" for t, s in items)
+    return ""
 
 
 def get_todo_stats(todos: list | None) -> dict[str, int]:
     """Get completion statistics."""
     if not todos:
         return {"total": 0, "pending": 0, "in_progress": 0, "completed": 0, "progress": 0}
-    
-    counts = {"pending": 0, "in_progress": 0, "completed": 0}
-    
-    for item in todos:
-        if "s" in item:
-            s = item["s"]
-            if s == "p": counts["pending"] += 1
-            elif s == "w": counts["in_progress"] += 1
-            elif s == "d": counts["completed"] += 1
-        else:
-            counts[item.get("status", "pending")] += 1
-    
+
+    # Counter accumulates in C; the per-item branch collapses to one dict-get
+    counts = Counter(
+        _STATUS_TO_LONG.get(item.get("s") or item.get("status", "pending"), "pending")
+        for item in todos
+    )
+
     total = len(todos)
-    done = counts["completed"]
-    
+
     return {
         "total": total,
-        **counts,
-        "progress": int((done / total) * 100) if total > 0 else 0,
+        "pending": counts["pending"],
+        "in_progress": counts["in_progress"],
+        "completed": counts["completed"],
+        "progress": (counts["completed"] * 100) // total,
     }
 
 
@@ -13,15 +13,7 @@ Never guess—verify with tools. Default to action over suggestions.
 - rb.angularDamping (not angularDrag)
 
 ## Your 6 Tools
-
-| Tool | Role | When to Use |
-|------|------|-------------|
-| `unity_query` | Observer | Read hierarchy, inspect objects, search assets, check logs/settings |
-| `unity_hierarchy` | Architect | Create, destroy, rename, reparent, duplicate GameObjects |
-| `unity_component` | Engineer | Add, modify, or remove components on GameObjects |
-| `unity_prefab` | Factory | Instantiate, create, modify, apply/revert prefabs |
-| `unity_scene` | Director | Open, save, create scenes; manage multi-scene setups |
-| `unity_refresh` | Compiler | Trigger script compilation after creating/editing C# files |
+TOOLS: unity_query=read hierarchy/inspect/search assets/logs/settings; unity_hierarchy=create/destroy/rename/reparent/duplicate GameObjects; unity_component=add/modify/remove components; unity_prefab=instantiate/create/modify/apply/revert prefabs; unity_scene=open/save/create/set_active scenes; unity_refresh=compile scripts after creating/editing C# files.
 
 ## Script Workflow (CRITICAL)
 
@@ -43,19 +35,17 @@ unity_component(action='modify', game_object_id=-74268, component_type='Transfor
 **Property Formats:** Vectors: `[x, y, z]` | Colors: `[r, g, b, a]` | Enums: string or int
 
 ## Decision Routing
-
-| Request | Action |
-|---------|--------|
-| Error/Bug/Crash | `unity_query(action='get_logs', log_filter='Error')` |
-| Show scene/hierarchy | `unity_query(action='hierarchy')` |
-| Move object | `unity_component(action='modify', component_type='Transform', properties={'m_LocalPosition': [...]})` |
-| Add component | `unity_component(action='add', component_type='...')` |
-| Spawn from prefab | `unity_prefab(action='instantiate_by_name', prefab_name='...')` |
-| Create new object | `unity_hierarchy(action='create', name='...', primitive_type='Cube')` |
-| Save scene | `unity_scene(action='save')` |
+ROUTE: error/bug/crash→unity_query(get_logs, log_filter='Error'); show scene/hierarchy→unity_query(hierarchy); move object→unity_component(modify, Transform, m_LocalPosition); add component→unity_component(add); spawn from prefab→unity_prefab(instantiate_by_name); create object→unity_hierarchy(create, primitive_type); save→unity_scene(save).
 
 ## Output Rules
 - Never generate documentation files (.md, README, summaries, guides) unless the user explicitly asks for them.
 - Cite evidence: "Player at position [0, 5, 0] after modification"
 - Be concise—developers are busy
 """
+
+# Encoded once at import for transports that want raw UTF-8 (the prompt goes
+# out on every turn; this amortizes the encode over the process lifetime)
+UNITY_AGENT_PROMPT_BYTES = UNITY_AGENT_PROMPT.encode("utf-8")
+
+# Rough chars/4 budget proxy - good enough for context accounting
+UNITY_AGENT_PROMPT_TOKEN_ESTIMATE = len(UNITY_AGENT_PROMPT) // 4
@@ -6,19 +6,47 @@ This runs alongside the existing WebSocket endpoint.
 Protocol spec: https://ai-sdk.dev/docs/ai-sdk-ui/stream-protocol
 """
 
+import asyncio
 import json
+import time
 import uuid
 import logging
 import traceback
-from datetime import datetime
+from secrets import token_hex
 from typing import AsyncGenerator, Any
+
+import orjson
 from fastapi import APIRouter, Request
 from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
 
-from utils import safe_serialize, truncate_output
+from utils import safe_serialize
 from database.repository import get_repository
+from managers import AdmissionController
+
+
+class ORJSONRequest(Request):
+    """Request whose json() parses the body with orjson instead of stdlib json."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """Route class that hands endpoints orjson-backed requests."""
+
+    def get_route_handler(self):
+        original_handler = super().get_route_handler()
+
+        async def handler(request: Request):
+            return await original_handler(ORJSONRequest(request.scope, request.receive))
+
+        return handler
+
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 # Will be set by init_chat_sse_routes()
 _graph = None
@@ -32,15 +60,31 @@ def init_chat_sse_routes(graph):
 # Setup logger for chat SSE
 logger = logging.getLogger("movesia.chat")
 
+# Bounds concurrent agent streams across all /api/chat requests
+_admission = AdmissionController()
+
 # =============================================================================
 # Debug helper for tool call rendering issues
 # =============================================================================
 def log_sse_event(event_type: str, data: dict, extra_info: str = ""):
     """Log SSE events being sent to frontend for debugging tool rendering."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     compact = json.dumps(data, default=str)[:300]
     logger.info(f"[SSE→UI] {event_type}: {compact} {extra_info}")
 
 
+# SSE framing bytes, hoisted so every frame reuses the same objects and is
+# assembled with a single join allocation.
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
+# Frames with no per-message state, encoded once at import time.
+_FINISH_FRAME = b'data: {"type":"finish"}\n\n'
+_FINISH_STEP_FRAME = b'data: {"type":"finish-step"}\n\n'
+_DONE_FRAME = b"data: [DONE]\n\n"
+
+
 class UIMessageStreamProtocol:
     """
     Implements Vercel AI SDK UI Message Stream Protocol v1.
@@ -53,41 +97,47 @@ class UIMessageStreamProtocol:
     - tool-output-available: Tool results
     - finish-step/finish: Complete the stream
     - error: Report errors
+
+    Frames are produced as bytes so static and per-message-constant frames
+    can be encoded once instead of per event.
     """
 
     def __init__(self):
         self.message_id = f"msg_{uuid.uuid4().hex}"
         self.text_id = f"text_{uuid.uuid4().hex}"
         self.text_started = False
+        # These frames only depend on the per-message ids, so encode them once.
+        self._start_frame = self._sse({"type": "start", "messageId": self.message_id})
+        self._text_start_frame = self._sse({"type": "text-start", "id": self.text_id})
+        self._text_end_frame = self._sse({"type": "text-end", "id": self.text_id})
 
-    def _sse(self, data: dict) -> str:
+    def _sse(self, data: dict) -> bytes:
         """Format as SSE data line."""
-        result = f"data: {json.dumps(data)}\n\n"
-        return result
+        return b"".join((_SSE_PREFIX, orjson.dumps(data), _SSE_SUFFIX))
 
-    def start(self) -> str:
+    def start(self) -> bytes:
         """Start a new assistant message."""
-        return self._sse({"type": "start", "messageId": self.message_id})
+        return self._start_frame
 
-    def text_start(self) -> str:
+    def text_start(self) -> bytes:
         """Start text content block."""
         self.text_started = True
-        return self._sse({"type": "text-start", "id": self.text_id})
+        return self._text_start_frame
 
-    def text_delta(self, content: str) -> str:
+    def text_delta(self, content: str) -> bytes:
         """Stream text delta."""
         if not content:
-            return ""
+            return b""
         return self._sse({"type": "text-delta", "id": self.text_id, "delta": content})
 
-    def text_end(self) -> str:
+    def text_end(self) -> bytes:
         """End text content block."""
         if not self.text_started:
-            return ""
+            return b""
         self.text_started = False
-        return self._sse({"type": "text-end", "id": self.text_id})
+        return self._text_end_frame
 
-    def tool_input_start(self, tool_call_id: str, tool_name: str) -> str:
+    def tool_input_start(self, tool_call_id: str, tool_name: str) -> bytes:
         """Start tool input streaming."""
         data = {
             "type": "tool-input-start",
@@ -97,7 +147,7 @@ class UIMessageStreamProtocol:
         log_sse_event("TOOL_INPUT_START", data)
         return self._sse(data)
 
-    def tool_input_delta(self, tool_call_id: str, delta: str) -> str:
+    def tool_input_delta(self, tool_call_id: str, delta: str) -> bytes:
         """Stream tool input delta."""
         return self._sse({
             "type": "tool-input-delta",
@@ -105,45 +155,137 @@ class UIMessageStreamProtocol:
             "inputTextDelta": delta
         })
 
-    def tool_input_available(self, tool_call_id: str, tool_name: str, input_data: Any) -> str:
-        """Tool input is fully available."""
-        data = {
+    def tool_input_available(self, tool_call_id: str, tool_name: str, input_json: bytes) -> bytes:
+        """Tool input is fully available. `input_json` is the already-encoded input."""
+        head = orjson.dumps({
             "type": "tool-input-available",
             "toolCallId": tool_call_id,
             "toolName": tool_name,
-            "input": input_data
-        }
-        log_sse_event("TOOL_INPUT_AVAILABLE", data)
-        return self._sse(data)
+        })
+        log_sse_event(
+            "TOOL_INPUT_AVAILABLE",
+            {"toolCallId": tool_call_id, "toolName": tool_name},
+            input_json[:120].decode(errors="ignore"),
+        )
+        # Splice the pre-encoded input in rather than decoding and re-encoding it.
+        return b"".join((_SSE_PREFIX, head[:-1], b',"input":', input_json, b"}", _SSE_SUFFIX))
 
-    def tool_output_available(self, tool_call_id: str, output: Any) -> str:
-        """Tool output is available."""
-        data = {
+    def tool_output_available(self, tool_call_id: str, output_json: bytes) -> bytes:
+        """Tool output is available. `output_json` is the already-encoded output."""
+        head = orjson.dumps({
             "type": "tool-output-available",
             "toolCallId": tool_call_id,
-            "output": output
-        }
-        log_sse_event("TOOL_OUTPUT_AVAILABLE", data)
-        return self._sse(data)
+        })
+        log_sse_event(
+            "TOOL_OUTPUT_AVAILABLE",
+            {"toolCallId": tool_call_id},
+            output_json[:120].decode(errors="ignore"),
+        )
+        return b"".join((_SSE_PREFIX, head[:-1], b',"output":', output_json, b"}", _SSE_SUFFIX))
 
-    def finish_step(self) -> str:
+    def finish_step(self) -> bytes:
         """Finish a step (after tool calls, before continuing)."""
-        data = {"type": "finish-step"}
-        log_sse_event("FINISH_STEP", data, "(tool execution complete)")
-        return self._sse(data)
+        log_sse_event("FINISH_STEP", {"type": "finish-step"}, "(tool execution complete)")
+        return _FINISH_STEP_FRAME
 
-    def finish(self) -> str:
+    def finish(self) -> bytes:
         """Finish the message."""
-        return self._sse({"type": "finish"})
+        return _FINISH_FRAME
 
-    def error(self, message: str) -> str:
+    def error(self, message: str) -> bytes:
         """Report an error."""
         logger.error(f"[SSE] Error: {message}")
         return self._sse({"type": "error", "errorText": message})
 
-    def done(self) -> str:
+    def done(self) -> bytes:
         """Signal end of stream."""
-        return "data: [DONE]\n\n"
+        return _DONE_FRAME
+
+
+def _encode_tool_output(output: Any, max_chars: int = 50000) -> bytes:
+    """Encode a tool output as a JSON string in one pass, size-limited.
+
+    Mirrors truncate_output's semantics (extracts .content from LangChain
+    messages, truncates with a marker) but encodes once with orjson instead
+    of building the string and re-serializing it in the frame.
+    """
+    content = getattr(output, "content", output)
+    if content is None:
+        return b'""'
+    text = content if isinstance(content, str) else str(content)
+    if len(text) > max_chars:
+        text = text[:max_chars] + f"... (truncated, {len(text)} total chars)"
+    return orjson.dumps(text)
+
+
+def _text_from_dict_block(block: dict) -> str:
+    """Extract text from a dict content block, empty string for non-text blocks."""
+    return block.get("text", "") if block.get("type") == "text" else ""
+
+
+# Dispatch table for chunk content blocks, keyed on the block's concrete type.
+# Avoids re-running the isinstance ladder for every streamed block.
+_BLOCK_TEXT_HANDLERS = {
+    dict: _text_from_dict_block,
+    str: lambda block: block,
+}
+
+# Coalescing window for adjacent text-delta frames. Models stream tokens far
+# faster than the UI needs repaints, so batching cuts frame overhead without
+# visible latency.
+_TEXT_DELTA_MAX_CHARS = 256
+_TEXT_DELTA_MAX_DELAY = 0.05  # seconds
+
+# SSE comment frame sent while the agent is quiet (e.g. a long tool call) so
+# proxies and load balancers don't drop the idle connection.
+_KEEPALIVE_FRAME = b": keep-alive\n\n"
+_KEEPALIVE_INTERVAL = 15.0  # seconds
+
+
+# Strong references to fire-and-forget metadata writes so they aren't
+# garbage-collected mid-flight.
+_background_writes: set = set()
+
+
+def _write_in_background(coro) -> None:
+    """Run a DB write concurrently instead of blocking the stream on it."""
+    task = asyncio.create_task(coro)
+    _background_writes.add(task)
+    task.add_done_callback(_background_writes.discard)
+
+
+async def _with_keepalive(
+    source: AsyncGenerator[bytes, None],
+    interval: float = _KEEPALIVE_INTERVAL,
+) -> AsyncGenerator[bytes, None]:
+    """Relay frames from `source`, emitting keepalive comments while idle."""
+    task = None
+    try:
+        iterator = source.__aiter__()
+        while True:
+            task = asyncio.ensure_future(iterator.__anext__())
+            while True:
+                try:
+                    frame = await asyncio.wait_for(asyncio.shield(task), interval)
+                except asyncio.TimeoutError:
+                    yield _KEEPALIVE_FRAME
+                    continue
+                except StopAsyncIteration:
+                    return
+                break
+            yield frame
+    finally:
+        if task is not None:
+            if not task.done():
+                task.cancel()
+            # Let the cancelled __anext__ actually unwind before closing;
+            # calling aclose() while the generator is mid-step raises
+            # "aclose(): asynchronous generator is already running"
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        await source.aclose()
 
 
 async def stream_agent_sse(
@@ -151,7 +293,7 @@ async def stream_agent_sse(
     thread_id: str,
     protocol: UIMessageStreamProtocol,
     is_first_message: bool = False
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """Stream agent execution using AI SDK UI Message Stream Protocol."""
     if _graph is None:
         raise RuntimeError("SSE routes not initialized. Call init_chat_sse_routes() first.")
@@ -159,24 +301,32 @@ async def stream_agent_sse(
     config = {"configurable": {"thread_id": thread_id}}
     input_data = {"messages": [("human", user_message)]}
 
+    # Bind hot helpers as locals once; global lookups add up over the
+    # thousands of events a single stream can produce
+    _safe_serialize = safe_serialize
+
     # Save conversation metadata
     repo = get_repository()
     conversation = await repo.get_or_create(session_id=thread_id)
 
-    # Set title from first message
+    # Set title from first message. These writes don't affect the response,
+    # so run them in the background rather than delaying the first frame.
     if conversation.title is None:
         title = user_message[:100].strip()
         if len(user_message) > 100:
             title += "..."
-        await repo.update_title(thread_id, title)
+        _write_in_background(repo.update_title(thread_id, title))
     else:
-        await repo.touch(thread_id)
+        _write_in_background(repo.touch(thread_id))
 
     # Track state
     has_text_content = False
     current_tool_calls = {}  # track tool_call_id -> tool_name
     tool_call_count = 0
-    start_time = datetime.now()
+    pending_text = []  # buffered text deltas awaiting a coalesced frame
+    pending_chars = 0
+    pending_since = 0.0
+    start_time = time.perf_counter()
 
     logger.info(f"[Stream] Starting for thread={thread_id[:16]}...")
 
@@ -192,29 +342,43 @@ async def stream_agent_sse(
                 if chunk and hasattr(chunk, "content"):
                     content = chunk.content
                     # Handle both string and list content
-                    if isinstance(content, str) and content:
+                    if isinstance(content, str):
+                        text = content
+                    elif isinstance(content, list):
+                        text = "".join(
+                            handler(block)
+                            for block in content
+                            if (handler := _BLOCK_TEXT_HANDLERS.get(type(block)))
+                        )
+                    else:
+                        text = ""
+
+                    if text:
                         # Start text block if not already started
                         if not has_text_content:
                             yield protocol.text_start()
                             has_text_content = True
-                        yield protocol.text_delta(content)
-                    elif isinstance(content, list):
-                        for block in content:
-                            text = ""
-                            if isinstance(block, dict) and block.get("type") == "text":
-                                text = block.get("text", "")
-                            elif isinstance(block, str):
-                                text = block
-
-                            if text:
-                                if not has_text_content:
-                                    yield protocol.text_start()
-                                    has_text_content = True
-                                yield protocol.text_delta(text)
+
+                        # Buffer the delta; emit one coalesced frame once the
+                        # size or time window is exceeded
+                        if not pending_text:
+                            pending_since = time.monotonic()
+                        pending_text.append(text)
+                        pending_chars += len(text)
+
+                        if (pending_chars >= _TEXT_DELTA_MAX_CHARS
+                                or time.monotonic() - pending_since >= _TEXT_DELTA_MAX_DELAY):
+                            yield protocol.text_delta("".join(pending_text))
+                            pending_text.clear()
+                            pending_chars = 0
 
             elif kind == "on_tool_start":
                 # End any ongoing text block before tool call
                 if has_text_content:
+                    if pending_text:
+                        yield protocol.text_delta("".join(pending_text))
+                        pending_text.clear()
+                        pending_chars = 0
                     yield protocol.text_end()
                     has_text_content = False
 
@@ -223,17 +387,19 @@ async def stream_agent_sse(
                 tool_call_id = event.get("run_id", str(uuid.uuid4()))
                 tool_call_count += 1
 
+                # Serialize the input once and reuse the encoded bytes everywhere
+                input_json = orjson.dumps(_safe_serialize(tool_input), default=str)
+
                 logger.info(f"[TOOL #{tool_call_count}] START: {tool_name} | id={tool_call_id[:12]}...")
-                logger.info(f"[TOOL #{tool_call_count}] INPUT: {json.dumps(safe_serialize(tool_input), default=str)[:200]}")
+                logger.info(f"[TOOL #{tool_call_count}] INPUT: {input_json[:200].decode(errors='ignore')}")
 
                 # Track the tool call
                 current_tool_calls[tool_call_id] = tool_name
 
                 # Stream tool input - these are the SSE events the frontend needs to render
                 yield protocol.tool_input_start(tool_call_id, tool_name)
-                serialized_input = safe_serialize(tool_input)
-                yield protocol.tool_input_delta(tool_call_id, json.dumps(serialized_input))
-                yield protocol.tool_input_available(tool_call_id, tool_name, serialized_input)
+                yield protocol.tool_input_delta(tool_call_id, input_json.decode())
+                yield protocol.tool_input_available(tool_call_id, tool_name, input_json)
 
             elif kind == "on_tool_end":
                 tool_call_id = event.get("run_id", "")
@@ -245,8 +411,7 @@ async def stream_agent_sse(
 
                 # Send tool result - use larger limit to avoid truncating valid JSON
                 # The UI components handle overflow/scrolling for large outputs
-                truncated_output = truncate_output(tool_output, max_length=50000)
-                yield protocol.tool_output_available(tool_call_id, truncated_output)
+                yield protocol.tool_output_available(tool_call_id, _encode_tool_output(tool_output))
 
                 # Remove from tracking
                 current_tool_calls.pop(tool_call_id, None)
@@ -254,12 +419,15 @@ async def stream_agent_sse(
                 # Signal step finished (agent may continue with more text)
                 yield protocol.finish_step()
 
-        # End any remaining text block
+        # Flush any buffered deltas and end any remaining text block
+        if pending_text:
+            yield protocol.text_delta("".join(pending_text))
+            pending_text.clear()
         if has_text_content:
             yield protocol.text_end()
 
         # Calculate duration
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
         logger.info(f"[Stream] Complete: {tool_call_count} tools in {duration:.2f}s")
 
         # Finish the message
@@ -267,16 +435,80 @@ async def stream_agent_sse(
         yield protocol.done()
 
     except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
         logger.error(f"[Stream] ERROR after {duration:.2f}s: {str(e)}")
         logger.error(f"[Stream] Traceback:\n{traceback.format_exc()}")
         # End text block if needed
+        if pending_text:
+            yield protocol.text_delta("".join(pending_text))
+            pending_text.clear()
         if has_text_content:
             yield protocol.text_end()
         yield protocol.error(str(e))
         yield protocol.done()
 
 
+def _join_text_parts(parts: list) -> str:
+    """Collect text from a content/parts list in a single pass."""
+    texts = [
+        part.get("text", "")
+        for part in parts
+        if isinstance(part, dict) and part.get("type") == "text"
+    ]
+    if not texts:
+        return ""
+    # Single text part is the overwhelmingly common case; skip the join
+    return texts[0] if len(texts) == 1 else " ".join(texts)
+
+
+def _extract_user_text(message: dict) -> str:
+    """
+    Extract user text from a message, handling BOTH formats:
+    1. Standard AI SDK: { "content": "text" } or { "content": [{ "type": "text", "text": "..." }] }
+    2. assistant-ui: { "parts": [{ "type": "text", "text": "..." }] }
+    """
+    content = message.get("content")
+    if content:
+        if isinstance(content, str):
+            return content
+        if isinstance(content, list):
+            text = _join_text_parts(content)
+            if text:
+                return text
+
+    parts = message.get("parts")
+    if parts:
+        text = _join_text_parts(parts)
+        if text:
+            return text
+
+    # Final fallback - check for direct text field
+    return message.get("text", "")
+
+
+# Shared headers for every SSE response from this endpoint.
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Vercel-AI-UI-Message-Stream": "v1",
+}
+
+
+def _error_response(message: str) -> StreamingResponse:
+    """Build a one-shot SSE stream carrying a single error frame."""
+    protocol = UIMessageStreamProtocol()
+
+    async def error_stream():
+        yield protocol.error(message)
+        yield protocol.done()
+
+    return StreamingResponse(
+        error_stream(),
+        media_type="text/event-stream",
+        headers=_SSE_HEADERS,
+    )
+
+
 @router.post("/api/chat")
 async def chat_sse(request: Request):
     """
@@ -287,88 +519,20 @@ async def chat_sse(request: Request):
         body = await request.json()
     except Exception as e:
         logger.error(f"[API] Failed to parse request body: {e}")
-        protocol = UIMessageStreamProtocol()
-        async def error_stream():
-            yield protocol.error(f"Invalid request body: {str(e)}")
-            yield protocol.done()
-        return StreamingResponse(
-            error_stream(),
-            media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Vercel-AI-UI-Message-Stream": "v1",
-            }
-        )
+        return _error_response(f"Invalid request body: {str(e)}")
 
     # AI SDK sends messages array
     messages = body.get("messages", [])
 
     if not messages:
-        protocol = UIMessageStreamProtocol()
-        async def error_stream():
-            yield protocol.error("No messages provided")
-            yield protocol.done()
-        return StreamingResponse(
-            error_stream(),
-            media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Vercel-AI-UI-Message-Stream": "v1",
-            }
-        )
+        return _error_response("No messages provided")
 
-    # Get the last user message
-    last_message = messages[-1]
-
-    # Extract text - handle BOTH formats:
-    # 1. Standard AI SDK: { "content": "text" } or { "content": [{ "type": "text", "text": "..." }] }
-    # 2. assistant-ui: { "parts": [{ "type": "text", "text": "..." }] }
-
-    user_text = ""
-
-    # Try "content" first (standard AI SDK format)
-    user_content = last_message.get("content")
-    if user_content:
-        if isinstance(user_content, str):
-            user_text = user_content
-        elif isinstance(user_content, list):
-            user_text = " ".join(
-                part.get("text", "")
-                for part in user_content
-                if isinstance(part, dict) and part.get("type") == "text"
-            )
-
-    # Try "parts" if content is empty (assistant-ui format)
-    if not user_text:
-        parts = last_message.get("parts", [])
-        if parts:
-            user_text = " ".join(
-                part.get("text", "")
-                for part in parts
-                if isinstance(part, dict) and part.get("type") == "text"
-            )
-
-    # Final fallback - check for direct text field
-    if not user_text:
-        user_text = last_message.get("text", "")
+    # Get the last user message and extract its text
+    user_text = _extract_user_text(messages[-1])
 
     if not user_text.strip():
         logger.warning("[API] Empty message content")
-        protocol = UIMessageStreamProtocol()
-        async def error_stream():
-            yield protocol.error("Empty message")
-            yield protocol.done()
-        return StreamingResponse(
-            error_stream(),
-            media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Vercel-AI-UI-Message-Stream": "v1",
-            }
-        )
+        return _error_response("Empty message")
 
     # ==========================================================================
     # Thread ID Management for Conversation Continuity
@@ -388,21 +552,34 @@ async def chat_sse(request: Request):
     # and the agent loses all context from previous messages.
     # ==========================================================================
 
-    thread_id = body.get("threadId") or request.headers.get("x-thread-id")
+    # Body is the common case; only touch the header map when it's absent
+    thread_id = body.get("threadId")
+    if not thread_id:
+        thread_id = request.headers.get("x-thread-id")
 
-    # If no thread ID provided, generate one (new conversation)
+    # If no thread ID provided, generate one (new conversation).
+    # token_hex skips the UUID object construction uuid4().hex pays for.
     if not thread_id or thread_id == "default":
-        thread_id = f"thread_{uuid.uuid4().hex}"
+        thread_id = f"thread_{token_hex(16)}"
+
+    # Shed load instead of letting every active stream degrade
+    if not await _admission.acquire():
+        return _error_response("Server is at capacity. Please try again shortly.")
 
     protocol = UIMessageStreamProtocol()
 
+    async def admitted_stream() -> AsyncGenerator[bytes, None]:
+        try:
+            async for frame in _with_keepalive(stream_agent_sse(user_text, thread_id, protocol)):
+                yield frame
+        finally:
+            await _admission.release()
+
     return StreamingResponse(
-        stream_agent_sse(user_text, thread_id, protocol),
+        admitted_stream(),
         media_type="text/event-stream",
         headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Vercel-AI-UI-Message-Stream": "v1",
+            **_SSE_HEADERS,
             "X-Thread-Id": thread_id,  # Return thread ID to frontend
         }
     )
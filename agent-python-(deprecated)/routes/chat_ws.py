@@ -9,7 +9,10 @@
 ##############################################################################
 """
 
+import asyncio
 import logging
+from typing import Optional
+
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from database.repository import get_repository
@@ -32,6 +35,20 @@ def init_chat_routes(chat_manager, unity_manager, stream_agent_response_func):
     _stream_agent_response = stream_agent_response_func
 
 
+def _log_stream_failure(task: asyncio.Task) -> None:
+    """Retrieve the stream task's outcome so failures are logged.
+
+    The endpoint never awaits the task (it may outlive the receive loop or
+    be superseded), so without this asyncio reports "Task exception was
+    never retrieved" on routine mid-stream disconnects.
+    """
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error(f"Agent stream task failed: {exc}")
+
+
 @router.websocket("/ws/chat/{session_id}")
 async def chat_websocket_endpoint(websocket: WebSocket, session_id: str):
     """
@@ -63,6 +80,10 @@ async def chat_websocket_endpoint(websocket: WebSocket, session_id: str):
         "unity_connected": _unity_manager.is_connected
     })
 
+    # Agent execution runs as a task so the receive loop stays responsive
+    # and a "cancel" message can stop it mid-stream
+    stream_task: Optional[asyncio.Task] = None
+
     try:
         while True:
             data = await websocket.receive_json()
@@ -72,6 +93,10 @@ async def chat_websocket_endpoint(websocket: WebSocket, session_id: str):
                 # User sent a chat message - run the agent
                 user_message = data.get("content", "")
 
+                # A new message supersedes any still-running stream
+                if stream_task and not stream_task.done():
+                    stream_task.cancel()
+
                 # Set conversation title from first user message
                 if is_first_message:
                     title = user_message[:100].strip()
@@ -83,12 +108,16 @@ async def chat_websocket_endpoint(websocket: WebSocket, session_id: str):
                     # Touch updated_at timestamp
                     await repo.touch(session_id)
 
-                await _stream_agent_response(websocket, user_message, config)
+                stream_task = asyncio.create_task(
+                    _stream_agent_response(websocket, user_message, config)
+                )
+                stream_task.add_done_callback(_log_stream_failure)
 
             elif msg_type == "cancel":
                 # User wants to cancel current operation
-                # TODO: Implement cancellation if needed
-                pass
+                if stream_task and not stream_task.done():
+                    stream_task.cancel()
+                    await websocket.send_json({"type": "cancelled"})
 
             elif msg_type == "ping":
                 await websocket.send_json({"type": "pong"})
@@ -105,4 +134,6 @@ async def chat_websocket_endpoint(websocket: WebSocket, session_id: str):
         except:
             pass
     finally:
+        if stream_task and not stream_task.done():
+            stream_task.cancel()
         await _chat_manager.unregister(session_id)
@@ -6,11 +6,12 @@ REST API endpoints for chat history.
 """
 
 import logging
+from collections import OrderedDict
 from typing import List, Optional, Any, Dict
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from database.repository import get_repository
 from database.engine import get_checkpoint_saver
@@ -67,6 +68,11 @@ class ConversationListResponse(BaseModel):
     offset: int
 
 
+# Validates a whole page of ORM rows in one C-accelerated pass instead of
+# constructing each ConversationResponse field-by-field in Python.
+_conversation_list_adapter = TypeAdapter(List[ConversationResponse])
+
+
 # =============================================================================
 # Endpoints
 # =============================================================================
@@ -83,18 +89,9 @@ async def list_conversations(
     conversations = await repo.list_all(limit=limit, offset=offset)
 
     return ConversationListResponse(
-        conversations=[
-            ConversationResponse(
-                id=c.id,
-                session_id=c.session_id,
-                title=c.title,
-                unity_project_path=c.unity_project_path,
-                unity_version=c.unity_version,
-                created_at=c.created_at,
-                updated_at=c.updated_at,
-            )
-            for c in conversations
-        ],
+        conversations=_conversation_list_adapter.validate_python(
+            conversations, from_attributes=True
+        ),
         total=len(conversations),
         limit=limit,
         offset=offset,
@@ -117,8 +114,10 @@ async def get_conversation(session_id: str):
     # Get messages from LangGraph checkpoint
     messages = await _get_messages_from_checkpoint(session_id)
 
-    return ConversationDetailResponse(
-        conversation=ConversationResponse(
+    # model_construct skips re-validating values that came straight from our
+    # own ORM row; FastAPI still validates against the response_model
+    return ConversationDetailResponse.model_construct(
+        conversation=ConversationResponse.model_construct(
             id=conversation.id,
             session_id=conversation.session_id,
             title=conversation.title,
@@ -179,6 +178,56 @@ async def delete_conversation(session_id: str):
 # Helper Functions
 # =============================================================================
 
+# Parsed-message cache keyed by thread id. Entries are (checkpoint_id, messages);
+# the checkpoint id acts as a version stamp, so a new checkpoint invalidates
+# the entry and repeated reads of an idle thread skip re-parsing entirely.
+_MESSAGES_CACHE_MAX = 64
+_messages_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+async def _probe_latest_checkpoint_id(checkpointer, session_id: str) -> Optional[str]:
+    """Fetch just the latest checkpoint id for a thread, or None.
+
+    checkpointer.aget() deserializes the whole checkpoint blob - the cost
+    the messages cache exists to avoid - so a hit probe must not go through
+    it. AsyncSqliteSaver exposes its aiosqlite connection and lock, letting
+    us run the same latest-row query aget() uses but select only the id
+    column. Returns None when the saver isn't the sqlite one (MemorySaver
+    fallback) or the probe fails, in which case the caller falls back to
+    the full aget() path.
+    """
+    conn = getattr(checkpointer, "conn", None)
+    lock = getattr(checkpointer, "lock", None)
+    if conn is None or lock is None:
+        return None
+    try:
+        async with lock:
+            cursor = await conn.execute(
+                "SELECT checkpoint_id FROM checkpoints "
+                "WHERE thread_id = ? AND checkpoint_ns = '' "
+                "ORDER BY checkpoint_id DESC LIMIT 1",
+                (session_id,),
+            )
+            row = await cursor.fetchone()
+            await cursor.close()
+    except Exception as e:
+        logger.debug(f"Checkpoint id probe failed for {session_id}: {e}")
+        return None
+    return row[0] if row else None
+
+
+def _store_messages_cache(
+    session_id: str,
+    checkpoint_id: Optional[str],
+    messages: List[MessageResponse],
+) -> None:
+    """Insert a parsed-message entry, evicting the least recently used."""
+    _messages_cache[session_id] = (checkpoint_id, messages)
+    _messages_cache.move_to_end(session_id)
+    while len(_messages_cache) > _MESSAGES_CACHE_MAX:
+        _messages_cache.popitem(last=False)
+
+
 async def _get_messages_from_checkpoint(session_id: str) -> List[MessageResponse]:
     """
     Retrieve messages from LangGraph's checkpoint state.
@@ -190,42 +239,92 @@ async def _get_messages_from_checkpoint(session_id: str) -> List[MessageResponse
         checkpointer = get_checkpoint_saver()
         config = {"configurable": {"thread_id": session_id}}
 
+        # Probe the cache before touching the checkpoint blob: comparing
+        # against just the latest checkpoint id means a hit skips aget()'s
+        # full deserialization, not merely the response assembly below.
+        cached = _messages_cache.get(session_id)
+        if cached is not None:
+            latest_id = await _probe_latest_checkpoint_id(checkpointer, session_id)
+            if latest_id is not None and cached[0] == latest_id:
+                _messages_cache.move_to_end(session_id)
+                return cached[1]
+
         # Get the latest checkpoint for this thread
         checkpoint = await checkpointer.aget(config)
 
         if not checkpoint:
             return []
 
+        checkpoint_id = checkpoint.get("id")
+        # Re-check after the full fetch: covers savers the cheap probe
+        # can't reach (MemorySaver fallback)
+        if cached is not None and cached[0] == checkpoint_id:
+            _messages_cache.move_to_end(session_id)
+            return cached[1]
+
         # Extract messages from checkpoint state
         # LangGraph stores messages in the 'channel_values' under 'messages'
         channel_values = checkpoint.get("channel_values", {})
         messages_data = channel_values.get("messages", [])
 
-        # First pass: collect tool outputs from ToolMessages
-        # Map tool_call_id -> output content
-        tool_outputs: Dict[str, Any] = {}
-        for msg in messages_data:
-            if hasattr(msg, "type") and msg.type == "tool":
-                # ToolMessage has tool_call_id and content (the output)
-                tool_call_id = getattr(msg, "tool_call_id", None)
-                if tool_call_id:
-                    tool_outputs[tool_call_id] = msg.content
+        if not messages_data:
+            return []
+
+        # Threads seeded from plain ("role", "content") tuples (common right
+        # at graph start) never carry tool calls; a tight comprehension skips
+        # the whole attribute-probing loop. The guard must scan the whole
+        # list: sampling the first element and relying on unpack failure is
+        # unsound for mixed lists, because LangChain messages are pydantic
+        # models whose __iter__ yields (field, value) pairs - starred unpack
+        # over one "succeeds" with garbage instead of raising. The
+        # all() pass is a single C-speed loop, still far cheaper than the
+        # general path.
+        if isinstance(messages_data[0], tuple) and all(
+            isinstance(m, tuple) and len(m) >= 2 for m in messages_data
+        ):
+            fast = [
+                MessageResponse.model_construct(
+                    role="user" if role == "human" else role,
+                    content=str(content),
+                    tool_calls=None,
+                )
+                for role, content, *_ in messages_data
+            ]
+            _store_messages_cache(session_id, checkpoint_id, fast)
+            return fast
+
+        # Single pass: AIMessage tool calls register a response slot here, and
+        # the ToolMessage that always follows them fills in the output.
+        pending_tool_calls: Dict[str, ToolCallResponse] = {}
 
         messages = []
         for msg in messages_data:
             # Messages can be tuples like ("human", "content") or message objects
             if isinstance(msg, tuple) and len(msg) >= 2:
                 role, content = msg[0], msg[1]
-                messages.append(MessageResponse(
+                messages.append(MessageResponse.model_construct(
                     role=role if role != "human" else "user",
-                    content=str(content)
+                    content=str(content),
+                    tool_calls=None,
                 ))
-            elif hasattr(msg, "type") and hasattr(msg, "content"):
-                # LangChain message objects
-                role = msg.type
+            else:
+                # LangChain message objects. EAFP: fetch the two hot
+                # attributes once instead of hasattr-probing (which does the
+                # same getattr internally) and then reading them again.
+                try:
+                    role = msg.type
+                    content = msg.content
+                except AttributeError:
+                    continue
 
-                # Skip tool messages - they're paired with AIMessage tool_calls
+                # Tool messages carry the output for an AIMessage tool call we
+                # already emitted - fill its slot instead of emitting a message
                 if role == "tool":
+                    tool_call_id = getattr(msg, "tool_call_id", None)
+                    if tool_call_id:
+                        tc_response = pending_tool_calls.pop(tool_call_id, None)
+                        if tc_response is not None:
+                            tc_response.output = msg.content
                     continue
 
                 if role == "human":
@@ -234,44 +333,53 @@ async def _get_messages_from_checkpoint(session_id: str) -> List[MessageResponse
                     role = "assistant"
 
                 # Extract text content (avoid stringifying tool call data)
-                content = msg.content
                 if isinstance(content, list):
                     # Content can be a list of blocks, extract text only
-                    text_parts = []
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "text":
-                            text_parts.append(block.get("text", ""))
-                        elif isinstance(block, str):
-                            text_parts.append(block)
-                    content = "".join(text_parts)
+                    content = "".join(
+                        block if isinstance(block, str) else block.get("text", "")
+                        for block in content
+                        if isinstance(block, str)
+                        or (isinstance(block, dict) and block.get("type") == "text")
+                    )
                 elif not isinstance(content, str):
                     content = str(content) if content else ""
 
-                # Extract tool calls from AIMessage
+                # Extract tool calls from AIMessage. Bind the duck-typed
+                # attribute once rather than probing hasattr then re-reading it
+                tool_calls = getattr(msg, "tool_calls", None)
                 tool_calls_response = None
-                if role == "assistant" and hasattr(msg, "tool_calls") and msg.tool_calls:
+                if role == "assistant" and tool_calls:
                     tool_calls_response = []
-                    for tc in msg.tool_calls:
-                        tc_id = tc.get("id", "") if isinstance(tc, dict) else getattr(tc, "id", "")
-                        tc_name = tc.get("name", "") if isinstance(tc, dict) else getattr(tc, "name", "")
-                        tc_args = tc.get("args", {}) if isinstance(tc, dict) else getattr(tc, "args", {})
-
-                        # Get the output from our collected tool outputs
-                        tc_output = tool_outputs.get(tc_id)
-
-                        tool_calls_response.append(ToolCallResponse(
+                    for tc in tool_calls:
+                        # One isinstance branch per tool call instead of three
+                        if isinstance(tc, dict):
+                            tc_id = tc.get("id", "")
+                            tc_name = tc.get("name", "")
+                            tc_args = tc.get("args", {})
+                        else:
+                            tc_id = getattr(tc, "id", "")
+                            tc_name = getattr(tc, "name", "")
+                            tc_args = getattr(tc, "args", {})
+
+                        tc_response = ToolCallResponse.model_construct(
                             id=tc_id,
                             name=tc_name,
                             input=tc_args if isinstance(tc_args, dict) else {},
-                            output=tc_output
-                        ))
-
-                messages.append(MessageResponse(
+                            output=None
+                        )
+                        # Output arrives with the ToolMessage later in the list
+                        if tc_id:
+                            pending_tool_calls[tc_id] = tc_response
+                        tool_calls_response.append(tc_response)
+
+                messages.append(MessageResponse.model_construct(
                     role=role,
                     content=content,
                     tool_calls=tool_calls_response
                 ))
 
+        _store_messages_cache(session_id, checkpoint_id, messages)
+
         return messages
 
     except Exception as e:
@@ -0,0 +1,55 @@
+"""
+Developer script: regenerate middlewares/_compressed_prompts.py.
+
+Runs LLMLingua token selection over the balanced write_todos description and
+writes the result as a Python string literal. Not imported at runtime - the
+server only reads the checked-in output, so llmlingua (and the compressor
+model it downloads) are dev-only dependencies.
+
+Usage (from the agent directory):
+
+    pip install llmlingua
+    python scripts/compress_prompts.py
+"""
+
+import sys
+from pathlib import Path
+
+AGENT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(AGENT_DIR))
+
+from middlewares.optimizedTodoMiddleware import BALANCED_TOOL_DESCRIPTION  # noqa: E402
+
+OUTPUT = AGENT_DIR / "middlewares" / "_compressed_prompts.py"
+
+# Status vocabulary and emphasis markers must survive compression verbatim -
+# the model keys its behavior off these exact tokens
+FORCE_TOKENS = ["CRITICAL", "IMPORTANT", "in_progress", "completed", "pending"]
+
+
+def main() -> None:
+    from llmlingua import PromptCompressor
+
+    compressor = PromptCompressor(model_name="NousResearch/Llama-2-7b-hf")
+    result = compressor.compress_prompt(
+        BALANCED_TOOL_DESCRIPTION,
+        rate=0.15,
+        force_tokens=FORCE_TOKENS,
+    )
+    compressed = result["compressed_prompt"]
+
+    print(f"Compressed {len(BALANCED_TOOL_DESCRIPTION)} -> {len(compressed)} chars")
+    print("--- review before committing ---")
+    print(compressed)
+    print("--------------------------------")
+
+    header = OUTPUT.read_text().split("# ~")[0]
+    OUTPUT.write_text(
+        f'{header}# regenerated by scripts/compress_prompts.py\n'
+        f'GIST_TOOL_DESCRIPTION = """{compressed}"""\n'
+    )
+    print(f"Wrote {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
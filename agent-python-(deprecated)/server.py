@@ -242,6 +242,16 @@ def get_interrupt_manager() -> InterruptManager:
 if __name__ == "__main__":
     import uvicorn
 
+    # libuv-backed event loop: 2-4x faster Future/Task scheduling and socket
+    # writes, which is most of what the chat/interrupt managers do. Optional -
+    # the stock selector loop works fine, just slower.
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     uvicorn.run(
         app,
         host=config.server.host,
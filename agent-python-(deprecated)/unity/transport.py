@@ -5,10 +5,11 @@ Provides standardized message formatting and sending functions
 to ensure consistent communication across all connections.
 """
 
-import json
 import logging
 import asyncio
 from typing import Any, Optional
+
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
 from .types import MovesiaMessage, ConnectionSource
@@ -49,7 +50,10 @@ async def send_to_client(
             )
             envelope = msg.to_dict()
 
-        await ws.send_json(envelope)
+        # orjson encodes compact UTF-8 several times faster than the stdlib
+        # path behind send_json; still a text frame, so the C# client is
+        # unaffected
+        await ws.send_text(orjson.dumps(envelope).decode())
         return True
         
     except WebSocketDisconnect:
@@ -11,6 +11,9 @@ Integrates all the best practices:
 
 import asyncio
 import logging
+import secrets
+import sys
+import time
 import uuid
 from typing import Optional, Callable, Awaitable, Any, Dict
 from contextlib import asynccontextmanager
@@ -109,6 +112,12 @@ class UnityManager:
         # Pending commands awaiting responses (keyed by message ID)
         self._pending_commands: Dict[str, asyncio.Future] = {}
 
+        # Ping envelope reused within a heartbeat tick (ts, envelope dict)
+        self._ping_cache: tuple = (0, None)
+
+        # Strong references to in-flight domain-event tasks
+        self._domain_event_tasks: set = set()
+
     # =========================================================================
     # Public API
     # =========================================================================
@@ -129,17 +138,16 @@ class UnityManager:
             session_id: Session identifier (from query param or handshake)
             conn_seq: Connection sequence number for takeover logic
         """
-        # Accept the WebSocket connection
-        await websocket.accept()
-
         # Generate connection ID
         cid = self._generate_cid()
 
         # Session and conn_seq come from URL query params (no handshake needed)
         # Project path and unity version can be sent later via "hello" message if needed
         if not session_id:
-            session_id = str(uuid.uuid4())
-        
+            # .hex skips the hyphen formatting of str(uuid4); the id is only
+            # used as an opaque key so the canonical form buys nothing
+            session_id = uuid.uuid4().hex
+
         # Create connection metadata
         connection = ExtendedConnection(
             cid=cid,
@@ -147,14 +155,16 @@ class UnityManager:
             conn_seq=conn_seq,
         )
 
-        # Try to accept the session
+        # Decide on the session before accepting the WebSocket, so stale
+        # duplicates (domain-reload reconnect storms) are refused at the
+        # handshake instead of paying for accept + welcome first
         decision = await self._sessions.accept(
             session_id=session_id,
             conn_seq=conn_seq,
             connection=connection,
             websocket=websocket,
         )
-        
+
         if not decision.accept:
             logger.info(f"Rejecting connection [{cid}]: {decision.reason}")
             await websocket.close(
@@ -162,7 +172,16 @@ class UnityManager:
                 reason=decision.reason or "duplicate session"
             )
             return
-        
+
+        # Accept the WebSocket connection
+        try:
+            await websocket.accept()
+        except Exception:
+            # Client vanished between the session decision and the handshake;
+            # release the slot we just claimed
+            await self._sessions.clear_if_match(session_id, websocket)
+            raise
+
         # Supersede old connection if needed
         if decision.supersede:
             try:
@@ -240,15 +259,19 @@ class UnityManager:
             session=self._current_session
         )
 
-        # Register for response using message ID (Unity echoes this back)
-        future: asyncio.Future = asyncio.get_event_loop().create_future()
-        self._pending_commands[msg.id] = future
-        logger.info(f"📤 Registered pending command: msg.id={msg.id}, pending_commands={list(self._pending_commands.keys())}")
+        # Register for response using message ID (Unity echoes this back).
+        # Interned ids make the response lookup a pointer comparison.
+        msg_id = sys.intern(msg.id)
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending_commands[msg_id] = future
+        # Lazy %s formatting - per-command logging is hot and usually filtered
+        logger.debug("📤 Registered pending command: msg.id=%s (%d pending)",
+                     msg.id, len(self._pending_commands))
 
         try:
             await send_to_client(self._current_ws, msg.to_dict())
 
-            logger.info(f"Sent command {command_type} [msg.id={msg.id}]")
+            logger.debug("Sent command %s [msg.id=%s]", command_type, msg.id)
 
             return await asyncio.wait_for(future, timeout)
 
@@ -256,7 +279,7 @@ class UnityManager:
             logger.warning(f"Command {command_type} timed out after {timeout}s")
             raise
         finally:
-            self._pending_commands.pop(msg.id, None)
+            self._pending_commands.pop(msg_id, None)
     
     @property
     def is_connected(self) -> bool:
@@ -299,15 +322,23 @@ class UnityManager:
         await self._command_router.cancel_all()
         
         sessions = await self._sessions.get_all_sessions()
-        for session_id, entry in sessions.items():
-            try:
-                await entry.websocket.close(
-                    code=CloseCode.GOING_AWAY,
-                    reason="server shutdown"
-                )
-            except Exception:
-                pass
-        
+        if sessions:
+            # Close concurrently, bounded so a flood of sessions doesn't spawn
+            # an unbounded number of close handshakes at once
+            semaphore = asyncio.Semaphore(16)
+
+            async def close_one(entry) -> None:
+                async with semaphore:
+                    try:
+                        await entry.websocket.close(
+                            code=CloseCode.GOING_AWAY,
+                            reason="server shutdown"
+                        )
+                    except Exception:
+                        pass
+
+            await asyncio.gather(*(close_one(entry) for entry in sessions.values()))
+
         await self._sessions.clear_all()
         self._current_ws = None
         self._current_connection = None
@@ -323,22 +354,37 @@ class UnityManager:
         connection: ExtendedConnection
     ) -> None:
         """Main loop for receiving and processing messages."""
-        while True:
-            # Receive message
-            data = await websocket.receive_text()
+        # Bound on how many frames we coalesce per wakeup, so a firehose of
+        # domain events can't starve heartbeat/cleanup indefinitely
+        max_batch = 32
+        drain_timeout = 0.0005
 
+        while True:
+            # Block for the first message, then opportunistically drain any
+            # frames already buffered (Unity flushes bursts after compilation).
+            # Processing the burst in one tight loop amortizes the per-message
+            # scheduler round-trip.
+            batch = [await websocket.receive_text()]
+            while len(batch) < max_batch:
+                try:
+                    batch.append(await asyncio.wait_for(
+                        websocket.receive_text(), timeout=drain_timeout
+                    ))
+                except asyncio.TimeoutError:
+                    break
 
-            # Route through message router
-            msg = await self._router.handle_message(websocket, connection, data)
+            for data in batch:
+                # Route through message router
+                msg = await self._router.handle_message(websocket, connection, data)
 
-            if msg is None:
-                continue
+                if msg is None:
+                    continue
 
-            # Check if this is a response to a pending command (matched by message ID)
-            # Unity echoes back the original message ID in its response
-            if msg.id in self._pending_commands:
-                future = self._pending_commands.get(msg.id)
-                if future and not future.done():
+                # Check if this is a response to a pending command (matched by message ID)
+                # Unity echoes back the original message ID in its response.
+                # Single .get with None sentinel replaces the membership + lookup pair.
+                future = self._pending_commands.get(sys.intern(msg.id)) if msg.id else None
+                if future is not None and not future.done():
                     future.set_result(msg.body)
     
     async def _cleanup_connection(
@@ -359,12 +405,13 @@ class UnityManager:
             self._current_connection = None
             self._current_session = None
         
-        # Cancel pending commands
-        for request_id, future in list(self._pending_commands.items()):
+        # Cancel pending commands. Swap the dict out instead of copying it
+        # with list() and clearing while callbacks may re-register entries.
+        pending, self._pending_commands = self._pending_commands, {}
+        for future in pending.values():
             if not future.done():
                 future.set_exception(RuntimeError("Connection closed"))
-        self._pending_commands.clear()
-        
+
         # Notify connection change
         await self._notify_connection_change(False)
         
@@ -375,22 +422,32 @@ class UnityManager:
         logger.info(f"Cleaned up connection [{connection.cid}]")
     
     async def _handle_domain_event(self, msg: MovesiaMessage) -> None:
-        """Forward domain events to subscribers."""
+        """Forward domain events to subscribers.
+
+        Handlers run as background tasks so a slow subscriber can't delay the
+        receive loop - and with it, command/response matching.
+        """
         if self._on_domain_event:
-            try:
-                await self._on_domain_event(msg)
-            except Exception as e:
-                logger.error(f"Error in domain event handler: {e}")
+            task = asyncio.create_task(self._run_domain_event(msg))
+            self._domain_event_tasks.add(task)
+            task.add_done_callback(self._domain_event_tasks.discard)
+
+    async def _run_domain_event(self, msg: MovesiaMessage) -> None:
+        """Invoke the domain-event callback, logging any failure."""
+        try:
+            await self._on_domain_event(msg)
+        except Exception as e:
+            logger.error(f"Error in domain event handler: {e}")
     
     async def _on_compilation_started(self, cid: str) -> None:
         """Handle Unity compilation start."""
         logger.info(f"Unity compilation started [{cid}]")
         
         # Cancel pending commands (they'll fail anyway)
-        for request_id, future in list(self._pending_commands.items()):
+        pending, self._pending_commands = self._pending_commands, {}
+        for future in pending.values():
             if not future.done():
                 future.set_exception(RuntimeError("Compilation started"))
-        self._pending_commands.clear()
     
     async def _on_compilation_finished(self, cid: str) -> None:
         """Handle Unity compilation finish."""
@@ -417,13 +474,21 @@ class UnityManager:
     
     async def _send_ping(self, ws: WebSocket, cid: str) -> None:
         """Send ping to a connection."""
-        msg = MovesiaMessage.create(
-            msg_type="hb",
-            body={},
-            source=ConnectionSource.VSCODE
-        )
+        # A heartbeat sweep pings every connection within the same second, so
+        # build the envelope once per tick instead of once per connection.
+        # Pong correlation is keyed by cid, not message id, so sharing is safe.
+        ts = int(time.time())
+        cached_ts, envelope = self._ping_cache
+        if envelope is None or ts != cached_ts:
+            msg = MovesiaMessage.create(
+                msg_type="hb",
+                body={},
+                source=ConnectionSource.VSCODE
+            )
+            envelope = msg.to_dict()
+            self._ping_cache = (ts, envelope)
         try:
-            await send_to_client(ws, msg.to_dict())
+            await send_to_client(ws, envelope)
         except Exception as e:
             logger.debug(f"Failed to send ping to [{cid}]: {e}")
     
@@ -446,9 +511,7 @@ class UnityManager:
     @staticmethod
     def _generate_cid() -> str:
         """Generate a short connection ID."""
-        import random
-        import string
-        return ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
+        return secrets.token_hex(4)
 
 
 # Convenience function for backwards compatibility with existing code
@@ -3,6 +3,7 @@ THE ENGINEER: unity_component
 "I need to change behavior and data."
 Consumes: add_component, remove_component, modify_component
 """
+import asyncio
 import json
 from typing import Literal, Optional
 from pydantic import BaseModel, Field
@@ -41,6 +42,54 @@ class ComponentSchema(BaseModel):
     )
 
 
+# Single source for the tool help text, shared by the coroutine docstring and
+# the StructuredTool description instead of maintaining two copies.
+_UNITY_COMPONENT_DESCRIPTION = """Edit components on GameObjects. This is the "Engineer".
+
+Actions:
+- 'add': Attach a component. Requires game_object_id + component_type.
+- 'modify': Change properties. Use EITHER component_id OR (game_object_id + component_type).
+- 'remove': Delete a component. Use EITHER component_id OR (game_object_id + component_type).
+
+RECOMMENDED WORKFLOW FOR MODIFY:
+Just use game_object_id + component_type - no need to inspect first!
+Example: unity_component(action='modify', game_object_id=-74268, component_type='Transform',
+                        properties={'m_LocalPosition': [0, 5, 0]})
+
+PROPERTY FORMAT:
+- Vectors use ARRAYS: {'m_LocalPosition': [0, 5, 0]} ✓
+- NOT objects: {'m_LocalPosition': {'x': 0}} ✗
+
+Common types: Transform, Rigidbody, BoxCollider, SphereCollider, MeshRenderer, AudioSource, Light, Camera"""
+
+
+# Validation error payloads are static; encode them once at import time.
+_ERR_ADD_MISSING_ID = json.dumps({
+    "error": "game_object_id is required for 'add'",
+    "hint": "First use unity_query(action='hierarchy') to find the GameObject ID",
+    "example": "unity_component(action='add', game_object_id=-74268, component_type='Rigidbody')"
+})
+_ERR_ADD_MISSING_TYPE = json.dumps({
+    "error": "component_type is required for 'add'",
+    "hint": "Specify the component type to add (e.g., Rigidbody, BoxCollider, AudioSource)",
+    "example": "unity_component(action='add', game_object_id=-74268, component_type='Rigidbody')"
+})
+_ERR_MODIFY_MISSING_PROPERTIES = json.dumps({
+    "error": "properties is required for 'modify'",
+    "hint": "Use array format for vectors: {'m_LocalPosition': [0, 5, 0]}",
+    "example": "unity_component(action='modify', game_object_id=-74268, component_type='Transform', properties={'m_LocalPosition': [0, 5, 0]})"
+})
+_ERR_MODIFY_BAD_TARGET = json.dumps({
+    "error": "For 'modify', provide EITHER component_id OR (game_object_id + component_type)",
+    "hint": "Easiest: use game_object_id + component_type, e.g., game_object_id=-74268, component_type='Transform'"
+})
+_ERR_REMOVE_BAD_TARGET = json.dumps({
+    "error": "For 'remove', provide EITHER component_id OR (game_object_id + component_type)",
+    "hint": "Easiest: use game_object_id + component_type from the hierarchy",
+    "example": "unity_component(action='remove', game_object_id=-74268, component_type='Rigidbody')"
+})
+
+
 async def _unity_component(
     action: Literal["add", "remove", "modify"],
     game_object_id: Optional[int] = None,
@@ -49,47 +98,16 @@ async def _unity_component(
     component_index: int = 0,
     properties: Optional[dict] = None
 ) -> str:
-    """
-    Edit components on GameObjects. This is the "Engineer".
-
-    Actions:
-    - 'add': Attach a component. Requires game_object_id + component_type.
-    - 'modify': Change properties. Use EITHER component_id OR (game_object_id + component_type).
-    - 'remove': Delete a component. Use EITHER component_id OR (game_object_id + component_type).
-
-    RECOMMENDED WORKFLOW FOR MODIFY:
-    Just use game_object_id + component_type - no need to inspect first!
-    Example: unity_component(action='modify', game_object_id=-74268, component_type='Transform',
-                            properties={'m_LocalPosition': [0, 5, 0]})
-
-    PROPERTY FORMAT:
-    - Vectors use ARRAYS: {'m_LocalPosition': [0, 5, 0]} ✓
-    - NOT objects: {'m_LocalPosition': {'x': 0}} ✗
-
-    Common types: Transform, Rigidbody, BoxCollider, SphereCollider, MeshRenderer, AudioSource, Light, Camera
-    """
     if action == "add":
         if game_object_id is None:
-            return json.dumps({
-                "error": "game_object_id is required for 'add'",
-                "hint": "First use unity_query(action='hierarchy') to find the GameObject ID",
-                "example": "unity_component(action='add', game_object_id=-74268, component_type='Rigidbody')"
-            })
+            return _ERR_ADD_MISSING_ID
         if component_type is None:
-            return json.dumps({
-                "error": "component_type is required for 'add'",
-                "hint": "Specify the component type to add (e.g., Rigidbody, BoxCollider, AudioSource)",
-                "example": "unity_component(action='add', game_object_id=-74268, component_type='Rigidbody')"
-            })
+            return _ERR_ADD_MISSING_TYPE
         result = await call_unity_async("add_component", instanceId=game_object_id, componentType=component_type)
 
     elif action == "modify":
         if properties is None:
-            return json.dumps({
-                "error": "properties is required for 'modify'",
-                "hint": "Use array format for vectors: {'m_LocalPosition': [0, 5, 0]}",
-                "example": "unity_component(action='modify', game_object_id=-74268, component_type='Transform', properties={'m_LocalPosition': [0, 5, 0]})"
-            })
+            return _ERR_MODIFY_MISSING_PROPERTIES
 
         # Build params - support both targeting methods
         params = {"properties": properties}
@@ -103,10 +121,7 @@ async def _unity_component(
             params["componentType"] = component_type
             params["componentIndex"] = component_index
         else:
-            return json.dumps({
-                "error": "For 'modify', provide EITHER component_id OR (game_object_id + component_type)",
-                "hint": "Easiest: use game_object_id + component_type, e.g., game_object_id=-74268, component_type='Transform'"
-            })
+            return _ERR_MODIFY_BAD_TARGET
 
         result = await call_unity_async("modify_component", **params)
 
@@ -120,37 +135,22 @@ async def _unity_component(
                               componentType=component_type,
                               componentIndex=component_index)
         else:
-            return json.dumps({
-                "error": "For 'remove', provide EITHER component_id OR (game_object_id + component_type)",
-                "hint": "Easiest: use game_object_id + component_type from the hierarchy",
-                "example": "unity_component(action='remove', game_object_id=-74268, component_type='Rigidbody')"
-            })
+            return _ERR_REMOVE_BAD_TARGET
     else:
         result = {"error": f"Unknown action: {action}"}
 
-    return json.dumps(result, indent=2)
+    # Unity responses (e.g. a full component dump) can be large; serialize in
+    # a worker thread so json.dumps doesn't stall the event loop
+    return await asyncio.to_thread(json.dumps, result, indent=2)
+
+
+_unity_component.__doc__ = _UNITY_COMPONENT_DESCRIPTION
 
 
 # Create the async tool using StructuredTool
 unity_component = StructuredTool.from_function(
     coroutine=_unity_component,
     name="unity_component",
-    description="""Edit components on GameObjects. This is the "Engineer".
-
-Actions:
-- 'add': Attach a component. Requires game_object_id + component_type.
-- 'modify': Change properties. Use EITHER component_id OR (game_object_id + component_type).
-- 'remove': Delete a component. Use EITHER component_id OR (game_object_id + component_type).
-
-RECOMMENDED WORKFLOW FOR MODIFY:
-Just use game_object_id + component_type - no need to inspect first!
-Example: unity_component(action='modify', game_object_id=-74268, component_type='Transform',
-                        properties={'m_LocalPosition': [0, 5, 0]})
-
-PROPERTY FORMAT:
-- Vectors use ARRAYS: {'m_LocalPosition': [0, 5, 0]} ✓
-- NOT objects: {'m_LocalPosition': {'x': 0}} ✗
-
-Common types: Transform, Rigidbody, BoxCollider, SphereCollider, MeshRenderer, AudioSource, Light, Camera""",
+    description=_UNITY_COMPONENT_DESCRIPTION,
     args_schema=ComponentSchema,
 )
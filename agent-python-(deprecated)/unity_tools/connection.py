@@ -6,6 +6,8 @@ Tools call `call_unity_async()` which routes through the UnityManager's WebSocke
 """
 import json
 import logging
+import time
+from collections import OrderedDict
 from typing import Any, Optional
 
 logger = logging.getLogger("movesia.unity_tools")
@@ -13,6 +15,21 @@ logger = logging.getLogger("movesia.unity_tools")
 # Global reference to unity_manager - set during server startup
 _unity_manager = None
 
+# Short-lived cache for idempotent reads the LLM tends to repeat while
+# exploring. Any mutating command clears it, so entries can only go stale
+# through out-of-band editor changes - bounded by the TTL.
+_IDEMPOTENT_ACTIONS = frozenset({
+    "get_hierarchy", "get_project_settings", "search_assets", "get_logs"
+})
+_READ_CACHE_MAX = 30
+_READ_CACHE_TTL = 5.0
+_read_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+
+def invalidate_reads() -> None:
+    """Drop cached read results (call after mutations that bypass call_unity_async)."""
+    _read_cache.clear()
+
 
 def set_unity_manager(manager) -> None:
     """
@@ -52,8 +69,28 @@ async def call_unity_async(action: str, **params) -> dict:
             "hint": "Check that the Movesia plugin is installed in Unity and the WebSocket connection is established."
         }
 
+    cache_key = None
+    if action in _IDEMPOTENT_ACTIONS:
+        cache_key = (action, tuple(sorted(params.items())))
+        cached = _read_cache.get(cache_key)
+        if cached is not None:
+            expires_at, value = cached
+            if time.monotonic() < expires_at:
+                _read_cache.move_to_end(cache_key)
+                return value
+            del _read_cache[cache_key]
+    else:
+        # A mutating command may change what any cached read would return
+        _read_cache.clear()
+
     try:
         result = await _unity_manager.send_and_wait(action, **params)
+        if cache_key is not None and not (
+            isinstance(result, dict) and result.get("success") is False
+        ):
+            _read_cache[cache_key] = (time.monotonic() + _READ_CACHE_TTL, result)
+            while len(_read_cache) > _READ_CACHE_MAX:
+                _read_cache.popitem(last=False)
         return result
     except TimeoutError as e:
         logger.warning(f"Unity command timed out: {action}")
@@ -3,15 +3,25 @@ THE OBSERVER: unity_query
 "I need to see what exists."
 Consumes: get_hierarchy, get_components, get_project_settings, get_logs, search_assets
 """
-import json
 from typing import Literal, Optional
-from pydantic import BaseModel, Field
+
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
 from langchain_core.tools import StructuredTool
 
 from .connection import call_unity_async
 
 
+def _dumps(obj) -> str:
+    """Serialize with orjson (2-space indent), decoded for the str tool contract."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
 class QuerySchema(BaseModel):
+    # extra="forbid" keeps the Rust validator on its exact-shape fast path
+    # (and surfaces hallucinated arg names instead of dropping them)
+    model_config = ConfigDict(extra="forbid")
+
     action: Literal["hierarchy", "inspect_object", "search_assets", "get_logs", "get_settings"] = Field(
         ..., description="The query type."
     )
@@ -33,6 +43,30 @@ class QuerySchema(BaseModel):
     settings_category: Optional[str] = Field(None, description="Settings category (e.g., 'physics', 'player', 'quality').")
 
 
+# Compile the validator core schema at import rather than on the first call
+QuerySchema.model_rebuild()
+
+
+# Single source for the tool help text, shared by the coroutine docstring and
+# the StructuredTool description instead of maintaining two copies.
+_UNITY_QUERY_DESCRIPTION = """Read the current state of the Unity Editor. This is the agent's "eyes".
+
+Actions:
+- 'hierarchy': See the scene tree structure.
+- 'inspect_object': Get components and properties of a specific object (Requires instance_id).
+- 'search_assets': Find prefabs, scripts, or assets in the project folders.
+- 'get_settings': Retrieve specific project settings.
+- 'get_logs': Check console for errors, warnings, or logs."""
+
+
+# Validation error payloads are static; encode them once at import time.
+_ERR_INSPECT_MISSING_ID = _dumps({
+    "error": "instance_id is required for 'inspect_object'",
+    "hint": "First use unity_query(action='hierarchy') to find GameObject IDs",
+    "example": "unity_query(action='inspect_object', instance_id=-74268)"
+})
+
+
 async def _unity_query(
     action: Literal["hierarchy", "inspect_object", "search_assets", "get_logs", "get_settings"],
     max_depth: int = 5,
@@ -42,25 +76,11 @@ async def _unity_query(
     log_filter: Optional[str] = None,
     settings_category: Optional[str] = None
 ) -> str:
-    """
-    Read the current state of the Unity Editor. This is the agent's "eyes".
-
-    Actions:
-    - 'hierarchy': See the scene tree structure.
-    - 'inspect_object': Get components and properties of a specific object (Requires instance_id).
-    - 'search_assets': Find prefabs, scripts, or assets in the project folders.
-    - 'get_settings': Retrieve specific project settings.
-    - 'get_logs': Check console for errors, warnings, or logs.
-    """
     if action == "hierarchy":
         result = await call_unity_async("get_hierarchy", maxDepth=max_depth)
     elif action == "inspect_object":
         if instance_id is None:
-            return json.dumps({
-                "error": "instance_id is required for 'inspect_object'",
-                "hint": "First use unity_query(action='hierarchy') to find GameObject IDs",
-                "example": "unity_query(action='inspect_object', instance_id=-74268)"
-            })
+            return _ERR_INSPECT_MISSING_ID
         result = await call_unity_async("get_components", instanceId=instance_id)
     elif action == "search_assets":
         result = await call_unity_async("search_assets", name=search_query, type=asset_type)
@@ -71,20 +91,16 @@ async def _unity_query(
     else:
         result = {"error": f"Unknown action: {action}"}
 
-    return json.dumps(result, indent=2)
+    return _dumps(result)
+
+
+_unity_query.__doc__ = _UNITY_QUERY_DESCRIPTION
 
 
 # Create the async tool using StructuredTool
 unity_query = StructuredTool.from_function(
     coroutine=_unity_query,
     name="unity_query",
-    description="""Read the current state of the Unity Editor. This is the agent's "eyes".
-
-Actions:
-- 'hierarchy': See the scene tree structure.
-- 'inspect_object': Get components and properties of a specific object (Requires instance_id).
-- 'search_assets': Find prefabs, scripts, or assets in the project folders.
-- 'get_settings': Retrieve specific project settings.
-- 'get_logs': Check console for errors, warnings, or logs.""",
+    description=_UNITY_QUERY_DESCRIPTION,
     args_schema=QuerySchema,
 )
@@ -6,14 +6,28 @@ Consumes: refresh_assets
 Note: This tool uses LangGraph's interrupt() to pause execution while Unity compiles.
 The interrupt is handled by the agent harness which communicates with Unity via WebSocket.
 """
-import json
+import logging
 from typing import Optional, List
-from pydantic import BaseModel, Field
+
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
 from langchain_core.tools import StructuredTool
 from langgraph.types import interrupt
 
+from .connection import invalidate_reads
+
+logger = logging.getLogger("movesia.unity_tools")
+
+
+def _dumps(obj) -> str:
+    """Serialize with orjson (2-space indent), decoded for the str tool contract."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
 
 class RefreshSchema(BaseModel):
+    # extra="forbid" keeps the Rust validator on its exact-shape fast path
+    model_config = ConfigDict(extra="forbid")
+
     watched_scripts: Optional[List[str]] = Field(
         None,
         description="List of specific script names (e.g. ['PlayerController']) to verify existence of after compilation."
@@ -24,26 +38,32 @@ class RefreshSchema(BaseModel):
     )
 
 
-def _unity_refresh(watched_scripts: Optional[List[str]] = None, type_limit: int = 20) -> str:
-    """
-    Trigger Unity Asset Database refresh and Script Compilation.
-    This is "The Compiler".
+# Compile the validator core schema at import rather than on the first call
+RefreshSchema.model_rebuild()
 
-    CRITICAL: You MUST use this tool after creating or editing C# scripts (.cs files).
-    Unity cannot add a component until the script is compiled.
 
-    Behavior:
-    1. Pauses agent execution while Unity compiles (handled by orchestrator).
-    2. Returns 'compilationErrors' if syntax errors exist.
-    3. Confirms if 'watched_scripts' are now valid components.
-    """
+# Single source for the tool help text, shared by the function docstring and
+# the StructuredTool description instead of maintaining two copies.
+_UNITY_REFRESH_DESCRIPTION = """Trigger Unity Asset Database refresh and Script Compilation. This is "The Compiler".
+
+CRITICAL: You MUST use this tool after creating or editing C# scripts (.cs files).
+Unity cannot add a component until the script is compiled.
+
+Behavior:
+1. Pauses agent execution while Unity compiles (handled by orchestrator).
+2. Returns 'compilationErrors' if syntax errors exist.
+3. Confirms if 'watched_scripts' are now valid components."""
+
 
+def _unity_refresh(watched_scripts: Optional[List[str]] = None, type_limit: int = 20) -> str:
     # ---------------------------------------------------------
     # BUILD THE REQUEST (will be sent to Unity by harness)
     # ---------------------------------------------------------
-    params = {"typeLimit": type_limit}
+    # Single dict literal per branch - no post-construction resize
     if watched_scripts:
-        params["watchedScripts"] = watched_scripts
+        params = {"typeLimit": type_limit, "watchedScripts": watched_scripts}
+    else:
+        params = {"typeLimit": type_limit}
 
     compile_request = {
         "action": "refresh_assets",
@@ -55,15 +75,19 @@ def _unity_refresh(watched_scripts: Optional[List[str]] = None, type_limit: int
     # ---------------------------------------------------------
     # The harness catches this, sends command to Unity via WebSocket,
     # waits for compilation to complete, then resumes with Unity's response
-    print(f"DEBUG: Pausing for compilation... request={compile_request}")
+    logger.debug("Pausing for compilation... request=%s", compile_request)
     result = interrupt(compile_request)  # <-- Returns Unity's response after resume
-    print(f"DEBUG: Resumed from compilation. result={result}")
+    logger.debug("Resumed from compilation. result=%s", result)
+
+    # A refresh bypasses call_unity_async, so clear cached reads explicitly:
+    # compilation changes assets, types, and logs
+    invalidate_reads()
 
     # ---------------------------------------------------------
     # HANDLE TIMEOUT - Tell agent to check logs
     # ---------------------------------------------------------
     if not result.get("success") and "timeout" in result.get("error", "").lower():
-        return json.dumps({
+        return _dumps({
             "status": "TIMEOUT",
             "message": "Compilation timed out after 40 seconds. This usually means Unity encountered an issue during domain reload.",
             "action_required": "Use unity_query with query_type='editor_log' to check Unity's console for errors or warnings.",
@@ -73,7 +97,7 @@ def _unity_refresh(watched_scripts: Optional[List[str]] = None, type_limit: int
                 "Script with infinite loop in static constructor",
                 "Missing assembly reference"
             ]
-        }, indent=2)
+        })
 
     # ---------------------------------------------------------
     # SMART RESPONSE PARSING (your existing logic)
@@ -84,11 +108,11 @@ def _unity_refresh(watched_scripts: Optional[List[str]] = None, type_limit: int
     # Case 1: Compilation Failed
     if not success or body.get("compilationErrors"):
         errors = body.get("compilationErrors", [])
-        return json.dumps({
+        return _dumps({
             "status": "COMPILATION_FAILED",
             "message": "Unity failed to compile the scripts. You must fix these errors:",
             "errors": errors
-        }, indent=2)
+        })
 
     # Case 2: Success
     response = {
@@ -107,7 +131,10 @@ def _unity_refresh(watched_scripts: Optional[List[str]] = None, type_limit: int
         else:
             response["next_step"] = "You can now use unity_component(action='add') with these scripts."
 
-    return json.dumps(response, indent=2)
+    return _dumps(response)
+
+
+_unity_refresh.__doc__ = _UNITY_REFRESH_DESCRIPTION
 
 
 # Create the tool using StructuredTool
@@ -116,14 +143,6 @@ def _unity_refresh(watched_scripts: Optional[List[str]] = None, type_limit: int
 unity_refresh = StructuredTool.from_function(
     func=_unity_refresh,
     name="unity_refresh",
-    description="""Trigger Unity Asset Database refresh and Script Compilation. This is "The Compiler".
-
-CRITICAL: You MUST use this tool after creating or editing C# scripts (.cs files).
-Unity cannot add a component until the script is compiled.
-
-Behavior:
-1. Pauses agent execution while Unity compiles (handled by orchestrator).
-2. Returns 'compilationErrors' if syntax errors exist.
-3. Confirms if 'watched_scripts' are now valid components.""",
+    description=_UNITY_REFRESH_DESCRIPTION,
     args_schema=RefreshSchema,
 )
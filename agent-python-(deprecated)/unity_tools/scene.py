@@ -3,15 +3,24 @@ THE DIRECTOR: unity_scene
 "I need to change the environment."
 Consumes: create_scene, open_scene, save_scene, set_active_scene
 """
-import json
 from typing import Literal, Optional
-from pydantic import BaseModel, Field
+
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
 from langchain_core.tools import StructuredTool
 
 from .connection import call_unity_async
 
 
+def _dumps(obj) -> str:
+    """Serialize with orjson (2-space indent), decoded for the str tool contract."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
 class SceneSchema(BaseModel):
+    # extra="forbid" keeps the Rust validator on its exact-shape fast path
+    model_config = ConfigDict(extra="forbid")
+
     action: Literal["open", "save", "create", "set_active"] = Field(
         ..., description="The scene operation."
     )
@@ -19,29 +28,49 @@ class SceneSchema(BaseModel):
     additive: bool = Field(False, description="Open/Create additively (keep current scene loaded)?")
 
 
+# Compile the validator core schema at import rather than on the first call
+SceneSchema.model_rebuild()
+
+
+# Single source for the tool help text, shared by the coroutine docstring and
+# the StructuredTool description instead of maintaining two copies.
+_UNITY_SCENE_DESCRIPTION = """Manage Scene files. This is the "Director".
+
+Actions:
+- 'open': Load a scene (use additive=True to keep current scene).
+- 'save': Save the current scene (optionally to a new path).
+- 'create': Create a new scene file.
+- 'set_active': Set which loaded scene is the active scene.
+
+IMPORTANT: Always save before opening a new scene to avoid losing changes."""
+
+
+# Validation error payloads are static; encode them once at import time.
+_ERR_OPEN_MISSING_PATH = _dumps({
+    "error": "path is required for 'open'",
+    "hint": "Provide the scene file path (relative to Assets folder)",
+    "example": "unity_scene(action='open', path='Assets/Scenes/Level2.unity')"
+})
+_ERR_CREATE_MISSING_PATH = _dumps({
+    "error": "path is required for 'create'",
+    "hint": "Provide the path for the new scene file (must end with .unity)",
+    "example": "unity_scene(action='create', path='Assets/Scenes/NewLevel.unity')"
+})
+_ERR_SET_ACTIVE_MISSING_PATH = _dumps({
+    "error": "path is required for 'set_active'",
+    "hint": "The scene must already be loaded (use additive=True when opening)",
+    "example": "unity_scene(action='set_active', path='Assets/Scenes/Level2.unity')"
+})
+
+
 async def _unity_scene(
     action: Literal["open", "save", "create", "set_active"],
     path: Optional[str] = None,
     additive: bool = False
 ) -> str:
-    """
-    Manage Scene files. This is the "Director".
-
-    Actions:
-    - 'open': Load a scene (use additive=True to keep current scene).
-    - 'save': Save the current scene (optionally to a new path).
-    - 'create': Create a new scene file.
-    - 'set_active': Set which loaded scene is the active scene.
-
-    IMPORTANT: Always save before opening a new scene to avoid losing changes.
-    """
     if action == "open":
         if path is None:
-            return json.dumps({
-                "error": "path is required for 'open'",
-                "hint": "Provide the scene file path (relative to Assets folder)",
-                "example": "unity_scene(action='open', path='Assets/Scenes/Level2.unity')"
-            })
+            return _ERR_OPEN_MISSING_PATH
         result = await call_unity_async("open_scene", path=path, additive=additive)
     elif action == "save":
         params = {}
@@ -50,38 +79,25 @@ async def _unity_scene(
         result = await call_unity_async("save_scene", **params)
     elif action == "create":
         if path is None:
-            return json.dumps({
-                "error": "path is required for 'create'",
-                "hint": "Provide the path for the new scene file (must end with .unity)",
-                "example": "unity_scene(action='create', path='Assets/Scenes/NewLevel.unity')"
-            })
+            return _ERR_CREATE_MISSING_PATH
         result = await call_unity_async("create_scene", savePath=path, additive=additive)
     elif action == "set_active":
         if path is None:
-            return json.dumps({
-                "error": "path is required for 'set_active'",
-                "hint": "The scene must already be loaded (use additive=True when opening)",
-                "example": "unity_scene(action='set_active', path='Assets/Scenes/Level2.unity')"
-            })
+            return _ERR_SET_ACTIVE_MISSING_PATH
         result = await call_unity_async("set_active_scene", path=path)
     else:
         result = {"error": f"Unknown action: {action}"}
 
-    return json.dumps(result, indent=2)
+    return _dumps(result)
+
+
+_unity_scene.__doc__ = _UNITY_SCENE_DESCRIPTION
 
 
 # Create the async tool using StructuredTool
 unity_scene = StructuredTool.from_function(
     coroutine=_unity_scene,
     name="unity_scene",
-    description="""Manage Scene files. This is the "Director".
-
-Actions:
-- 'open': Load a scene (use additive=True to keep current scene).
-- 'save': Save the current scene (optionally to a new path).
-- 'create': Create a new scene file.
-- 'set_active': Set which loaded scene is the active scene.
-
-IMPORTANT: Always save before opening a new scene to avoid losing changes.""",
+    description=_UNITY_SCENE_DESCRIPTION,
     args_schema=SceneSchema,
 )